@@ -0,0 +1,48 @@
+"""
+Numba kernels for the cost calculator.
+
+The adjustment-cost arithmetic is branchy scalar math evaluated once per
+candidate parameter per frame; compiling it eagerly (signature given up
+front, cache=True) removes the interpreter overhead without paying a JIT
+stall on the first real call.
+"""
+
+from numba import njit
+
+
+@njit('float64(int64, int64, float64, float64, float64)', cache=True)
+def cost_kernel(current_idx, target_idx, base_cost, direction, feature_delta):
+    """
+    Compute the adjustment cost from pre-resolved indices.
+
+    Args:
+        current_idx: Index of the current value in the parameter range,
+            or -1 if it could not be resolved
+        target_idx: Index of the target value, or -1 if unresolved
+        base_cost: Base cost for the parameter
+        direction: Preferred direction encoded as +1.0 (increase),
+            -1.0 (decrease) or 0.0 (either)
+        feature_delta: How far the feature is from the acceptable range
+
+    Returns:
+        Calculated cost for this adjustment (lower is better)
+    """
+    cost = base_cost
+
+    if current_idx >= 0 and target_idx >= 0:
+        adjustment_distance = abs(target_idx - current_idx)
+        if adjustment_distance > 0:
+            cost *= 1.0 + adjustment_distance * 0.2
+
+        if direction > 0.0 and target_idx < current_idx:
+            cost *= 1.5
+        elif direction < 0.0 and target_idx > current_idx:
+            cost *= 1.5
+
+    abs_delta = abs(feature_delta)
+    if abs_delta > 0.1:
+        cost *= 0.8
+    elif abs_delta < 0.02:
+        cost *= 1.2
+
+    return cost
@@ -0,0 +1,48 @@
+"""
+AOT build script for the cost kernels.
+
+The @njit kernel in _numba_kernels.py is compiled eagerly at import and
+disk-cached, but the very first run on a fresh machine still pays LLVM
+codegen. Running this script ahead of time ships the kernel as a regular
+extension module instead, so no process ever JITs it:
+
+    python src/cost/compile_kernels.py
+
+produces cost/_cost_ext.*.so, which cost_functions imports in preference
+to the JIT kernel.
+"""
+
+from numba.pycc import CC
+
+cc = CC('_cost_ext')
+
+
+@cc.export('cost_kernel', 'f8(i8, i8, f8, f8, f8)')
+def cost_kernel(current_idx, target_idx, base_cost, direction, feature_delta):
+    cost = base_cost
+
+    if current_idx >= 0 and target_idx >= 0:
+        adjustment_distance = abs(target_idx - current_idx)
+        if adjustment_distance > 0:
+            cost *= 1.0 + adjustment_distance * 0.2
+
+        if direction > 0.0 and target_idx < current_idx:
+            cost *= 1.5
+        elif direction < 0.0 and target_idx > current_idx:
+            cost *= 1.5
+
+    abs_delta = abs(feature_delta)
+    if abs_delta > 0.1:
+        cost *= 0.8
+    elif abs_delta < 0.02:
+        cost *= 1.2
+
+    return cost
+
+
+if __name__ == '__main__':
+    import os
+    # Emit the extension next to this script so `from cost._cost_ext
+    # import cost_kernel` resolves
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.compile()
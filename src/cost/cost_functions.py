@@ -7,9 +7,24 @@ their impact on image quality and system performance.
 """
 
 import json
+import numpy as np
 from typing import Dict, List, Tuple, Union
 from dataclasses import dataclass
 
+# Compiled cost arithmetic: prefer the AOT extension (built with
+# compile_kernels.py, no JIT warm-up at all), then the eagerly compiled
+# Numba kernel; the pure Python expression below remains as fallback.
+try:
+    from cost._cost_ext import cost_kernel
+except ImportError:
+    try:
+        from cost._numba_kernels import cost_kernel
+    except ImportError:
+        cost_kernel = None
+
+# Preferred-direction encoding for the kernel
+_DIRECTION_CODE = {'increase': 1.0, 'decrease': -1.0, 'either': 0.0}
+
 
 @dataclass
 class ParameterCost:
@@ -40,6 +55,10 @@ class CostFunctionCalculator:
         
         self.parameter_costs = self._load_parameter_costs(config_file)
         self.hysteresis_config = self._load_hysteresis_config(config_file)
+        # Memoized hysteresis bounds keyed by (feature, range): the bounds
+        # are pure arithmetic over the config percentages, recomputed
+        # per-frame per-feature otherwise
+        self._bounds_cache = {}
         
     def _load_parameter_costs(self, config_file: str) -> Dict[str, ParameterCost]:
         """Load parameter cost configuration from JSON file."""
@@ -117,67 +136,80 @@ class CostFunctionCalculator:
     def calculate_adjustment_cost(
         self, 
         parameter: str, 
-        current_value: Union[int, str], 
+        current_value: Union[int, str],
         target_value: Union[int, str],
         param_range: List[Union[int, str]],
-        feature_delta: float
+        feature_delta: float,
+        index_map: Dict[Union[int, str], int] = None
     ) -> float:
         """
         Calculate the cost of adjusting a specific parameter.
-        
+
         Args:
             parameter: Name of the camera parameter
             current_value: Current parameter value
             target_value: Desired parameter value
             param_range: Available parameter values
             feature_delta: How far the feature is from acceptable range
-            
+            index_map: Optional value -> index map for param_range; when
+                given, index resolution is a dict hit with no linear scan
+                or string conversion
+
         Returns:
             Calculated cost for this adjustment (lower is better)
         """
+        # No-op adjustments are trivially free: skip the lookups and
+        # arithmetic entirely (common when the adjuster is in steady state)
+        if str(current_value) == str(target_value):
+            return 0.0
+
         if parameter not in self.parameter_costs:
             return 10.0  # High cost for unknown parameters
-            
+
         param_cost = self.parameter_costs[parameter]
-        
+
+        # Resolve indices once; -1 signals "not found" and skips the
+        # index-based scalings, matching the old try/except behaviour
+        if index_map is not None:
+            current_idx = index_map.get(current_value, -1)
+            target_idx = index_map.get(target_value, -1)
+            if current_idx < 0 or target_idx < 0:
+                current_idx = target_idx = -1
+        else:
+            try:
+                current_idx = param_range.index(str(current_value))
+                target_idx = param_range.index(str(target_value))
+            except (ValueError, IndexError):
+                current_idx = target_idx = -1
+
+        if cost_kernel is not None:
+            return cost_kernel(
+                current_idx, target_idx, param_cost.base_cost,
+                _DIRECTION_CODE.get(param_cost.preferred_direction, 0.0),
+                feature_delta)
+
         # Base cost from configuration
         cost = param_cost.base_cost
-        
-        # Scale cost based on how far we need to adjust
-        try:
-            current_idx = param_range.index(str(current_value))
-            target_idx = param_range.index(str(target_value))
-            adjustment_distance = abs(target_idx - current_idx)
-            
+
+        if current_idx >= 0 and target_idx >= 0:
             # Increase cost for larger adjustments
+            adjustment_distance = abs(target_idx - current_idx)
             if adjustment_distance > 0:
                 cost *= (1 + adjustment_distance * 0.2)
-                
-        except (ValueError, IndexError):
-            # If we can't find indices, use base cost
-            pass
-        
-        # Apply directional preference penalty
-        if param_cost.preferred_direction != 'either':
-            try:
-                current_idx = param_range.index(str(current_value))
-                target_idx = param_range.index(str(target_value))
-                
-                if param_cost.preferred_direction == 'increase' and target_idx < current_idx:
-                    cost *= 1.5  # Penalty for going against preference
-                elif param_cost.preferred_direction == 'decrease' and target_idx > current_idx:
-                    cost *= 1.5
-                    
-            except (ValueError, IndexError):
-                pass
-        
+
+            # Apply directional preference penalty
+            if param_cost.preferred_direction == 'increase' and target_idx < current_idx:
+                cost *= 1.5  # Penalty for going against preference
+            elif param_cost.preferred_direction == 'decrease' and target_idx > current_idx:
+                cost *= 1.5
+
         # Scale cost based on feature delta magnitude
         # Larger deltas should prefer more effective parameters
         if abs(feature_delta) > 0.1:  # Large deviation
             cost *= 0.8  # Slightly favor more effective adjustments
         elif abs(feature_delta) < 0.02:  # Small deviation
             cost *= 1.2  # Slightly penalize adjustments for small deviations
-            
+
         return cost
     
     def get_hysteresis_bounds(
@@ -196,21 +228,28 @@ class CostFunctionCalculator:
             Tuple of (inner_bounds, outer_bounds) where each is (min, max)
         """
         min_val, max_val = acceptable_range
+        cache_key = (feature_name, min_val, max_val)
+        bounds = self._bounds_cache.get(cache_key)
+        if bounds is not None:
+            return bounds
+
         range_size = max_val - min_val
-        
+
         # Get hysteresis percentages
         dead_band_pct = self.hysteresis_config.get('dead_band_percentage', 0.05)
         inner_pct = self.hysteresis_config.get('inner_threshold_percentage', 0.02)
         outer_pct = self.hysteresis_config.get('outer_threshold_percentage', 0.08)
-        
+
         # Calculate bounds
         inner_expansion = range_size * inner_pct
         outer_expansion = range_size * outer_pct
-        
+
         inner_bounds = (min_val + inner_expansion, max_val - inner_expansion)
         outer_bounds = (min_val - outer_expansion, max_val + outer_expansion)
-        
-        return inner_bounds, outer_bounds
+
+        bounds = (inner_bounds, outer_bounds)
+        self._bounds_cache[cache_key] = bounds
+        return bounds
     
     def should_adjust_feature(
         self, 
@@ -256,6 +295,69 @@ class CostFunctionCalculator:
         else:
             return False, f"Value {feature_value:.3f} in hysteresis zone, preventing oscillation"
     
+    @staticmethod
+    def quantize(value: float) -> int:
+        """
+        Quantize a normalized [0, 1] feature value to a uint8 bucket.
+
+        The 1/255 step (~0.004) is well below the decision granularity of
+        the acceptable ranges, so quantized compares reach the same
+        adjust/hold decisions while staying in integer arithmetic.
+        """
+        q = int(round(value * 255.0))
+        return 0 if q < 0 else (255 if q > 255 else q)
+
+    def get_outer_bounds_q(self, feature_name: str, acceptable_range: Tuple[float, float]) -> Tuple[int, int]:
+        """
+        Outer hysteresis bounds quantized to uint8 buckets (memoized).
+
+        Args:
+            feature_name: Name of the image feature
+            acceptable_range: Original acceptable range (min, max)
+
+        Returns:
+            Tuple (q_lo, q_hi) of quantized outer bounds
+        """
+        min_val, max_val = acceptable_range
+        cache_key = ('q', feature_name, min_val, max_val)
+        bounds = self._bounds_cache.get(cache_key)
+        if bounds is None:
+            _, (outer_lo, outer_hi) = self.get_hysteresis_bounds(feature_name, acceptable_range)
+            bounds = (self.quantize(outer_lo), self.quantize(outer_hi))
+            self._bounds_cache[cache_key] = bounds
+        return bounds
+
+    def should_adjust_q(self, feature_name: str, qvalue: int, acceptable_range: Tuple[float, float]) -> bool:
+        """
+        Integer-only adjustment check on a quantized feature value.
+
+        Args:
+            feature_name: Name of the image feature
+            qvalue: Feature value quantized with quantize()
+            acceptable_range: Original acceptable range
+
+        Returns:
+            True when the value lies outside the quantized outer bounds
+        """
+        q_lo, q_hi = self.get_outer_bounds_q(feature_name, acceptable_range)
+        return qvalue < q_lo or qvalue > q_hi
+
+    def should_adjust_batch(self, values: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        """
+        Vectorized adjustment check across several features at once.
+
+        Args:
+            values: Feature values, shape (N,)
+            ranges: Acceptable ranges, shape (N, 2) with (min, max) rows
+
+        Returns:
+            Boolean array, True where the value lies outside the outer
+            hysteresis bounds - the only case should_adjust_feature adjusts
+        """
+        expansion = (ranges[:, 1] - ranges[:, 0]) * self.hysteresis_config.get(
+            'outer_threshold_percentage', 0.08)
+        return (values < ranges[:, 0] - expansion) | (values > ranges[:, 1] + expansion)
+
     def find_best_adjustment(
         self,
         feature_name: str,
@@ -263,11 +365,12 @@ class CostFunctionCalculator:
         acceptable_range: Tuple[float, float],
         current_params: Dict[str, Union[int, str]],
         param_ranges: Dict[str, List[Union[int, str]]],
-        adjustment_rules: Dict[str, List[str]]
+        adjustment_rules: Dict[str, List[str]],
+        param_indices: Dict[str, Dict[Union[int, str], int]] = None
     ) -> Tuple[str, Union[int, str], float]:
         """
         Find the best parameter adjustment for a given feature.
-        
+
         Args:
             feature_name: Name of the image feature to adjust
             feature_value: Current feature value
@@ -275,7 +378,9 @@ class CostFunctionCalculator:
             current_params: Current camera parameters
             param_ranges: Available parameter ranges
             adjustment_rules: Rules mapping features to adjustable parameters
-            
+            param_indices: Optional per-parameter value -> index maps,
+                avoiding linear scans over the ranges
+
         Returns:
             Tuple of (best_parameter, new_value, cost)
         """
@@ -313,11 +418,15 @@ class CostFunctionCalculator:
                 
             current_value = current_params[param_name]
             param_range = param_ranges[param_name]
-            
+            index_map = param_indices.get(param_name) if param_indices else None
+
             # Find next value in appropriate direction
             try:
-                current_idx = param_range.index(str(current_value))
-                
+                if index_map is not None:
+                    current_idx = index_map[current_value]
+                else:
+                    current_idx = param_range.index(str(current_value))
+
                 if increase_needed and current_idx < len(param_range) - 1:
                     next_value = param_range[current_idx + 1]
                 elif not increase_needed and current_idx > 0:
@@ -328,7 +437,8 @@ class CostFunctionCalculator:
                     
                 # Calculate cost for this adjustment
                 cost = self.calculate_adjustment_cost(
-                    param_name, current_value, next_value, param_range, feature_delta
+                    param_name, current_value, next_value, param_range,
+                    feature_delta, index_map
                 )
                 
                 print(f"[COST DEBUG]   {param_name}: {current_value} -> {next_value}, cost={cost:.2f}")
@@ -338,7 +448,7 @@ class CostFunctionCalculator:
                     best_param = param_name
                     best_value = next_value
                     
-            except (ValueError, IndexError) as e:
+            except (KeyError, ValueError, IndexError) as e:
                 print(f"[COST DEBUG]   {param_name}: ERROR - {e}")
                 continue
         
@@ -0,0 +1,59 @@
+"""
+Fused green-mask kernel for ROI detection.
+
+The pitch mask used to be produced by a full BGR->HSV cvtColor (three output
+planes) followed by cv2.inRange - two complete passes plus a 3x HSV
+temporary. This kernel converts and thresholds in one parallel sweep,
+writing the uint8 mask directly. Numba is an optional dependency;
+roi_detection.py falls back to the OpenCV chain when this module fails to
+import.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def green_mask_u8(img, h_lo, h_hi, s_lo, s_hi, v_lo, v_hi, out):
+    """
+    Threshold a BGR uint8 frame against an HSV range in a single pass.
+
+    Args:
+        img: BGR image as a (H, W, 3) uint8 array
+        h_lo, h_hi: Hue bounds on OpenCV's 0-180 scale
+        s_lo, s_hi: Saturation bounds (0-255)
+        v_lo, v_hi: Value bounds (0-255)
+        out: (H, W) uint8 output mask, written as 255 / 0
+    """
+    height = img.shape[0]
+    width = img.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            b = np.float64(img[y, x, 0])
+            g = np.float64(img[y, x, 1])
+            r = np.float64(img[y, x, 2])
+
+            max_c = max(b, max(g, r))
+            min_c = min(b, min(g, r))
+            delta = max_c - min_c
+
+            # OpenCV HSV for 8-bit: H in [0, 180), S and V in [0, 255]
+            if delta == 0.0:
+                hue = 0.0
+            elif max_c == r:
+                hue = 30.0 * (g - b) / delta
+            elif max_c == g:
+                hue = 60.0 + 30.0 * (b - r) / delta
+            else:
+                hue = 120.0 + 30.0 * (r - g) / delta
+            if hue < 0.0:
+                hue += 180.0
+
+            sat = 0.0 if max_c == 0.0 else delta * 255.0 / max_c
+
+            if (h_lo <= hue <= h_hi
+                    and s_lo <= sat <= s_hi
+                    and v_lo <= max_c <= v_hi):
+                out[y, x] = 255
+            else:
+                out[y, x] = 0
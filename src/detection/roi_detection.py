@@ -10,6 +10,13 @@ import numpy as np
 from typing import Tuple, Optional, Dict, Any
 import json
 
+# Fused HSV-threshold kernel (optional Numba dependency); the OpenCV
+# cvtColor + inRange chain below remains as fallback.
+try:
+    from detection._roi_kernel import green_mask_u8
+except ImportError:
+    green_mask_u8 = None
+
 
 class ROIDetector:
     """
@@ -48,6 +55,17 @@ class ROIDetector:
             'mask_percentage': 0.0,
             'last_update': 0
         }
+
+        # Reusable per-frame buffers, sized lazily on the first frame:
+        # allocating a fresh mask (and a ~2 MB ROI image) 30 times a second
+        # is pure allocator pressure
+        self._mask_buf = None
+        self._roi_buf = None
+        if green_mask_u8 is not None:
+            # Prime the JIT on a dummy frame so the first real call does
+            # not pay the compile stall
+            green_mask_u8(np.zeros((4, 4, 3), np.uint8), 0.0, 180.0, 0.0,
+                          255.0, 0.0, 255.0, np.empty((4, 4), np.uint8))
     
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
@@ -67,12 +85,27 @@ class ROIDetector:
         Returns:
             Binary mask where 1 indicates pitch pixels
         """
-        # Convert BGR to HSV
-        hsv_image = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2HSV)
-        
-        # Create mask for green pitch
-        mask = cv2.inRange(hsv_image, self.green_hsv_lower, self.green_hsv_upper)
-        
+        if self._mask_buf is None or self._mask_buf.shape != image_bgr.shape[:2]:
+            self._mask_buf = np.empty(image_bgr.shape[:2], np.uint8)
+
+        if green_mask_u8 is not None:
+            # Fused convert-and-threshold pass into a reused buffer; no
+            # 3-plane HSV temporary
+            lower, upper = self.green_hsv_lower, self.green_hsv_upper
+            green_mask_u8(np.ascontiguousarray(image_bgr),
+                          float(lower[0]), float(upper[0]),
+                          float(lower[1]), float(upper[1]),
+                          float(lower[2]), float(upper[2]),
+                          self._mask_buf)
+            mask = self._mask_buf
+        else:
+            # Convert BGR to HSV
+            hsv_image = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2HSV)
+
+            # Create mask for green pitch, thresholded into the reused buffer
+            mask = cv2.inRange(hsv_image, self.green_hsv_lower, self.green_hsv_upper, dst=self._mask_buf)
+
+
         # Apply morphological operations to clean noise
         mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.morph_kernel, iterations=self.morph_iterations)
         mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.morph_kernel, iterations=self.morph_iterations)
@@ -131,12 +164,44 @@ class ROIDetector:
             if self.mask_stats['mask_percentage'] < 5.0:  # Less than 5% coverage
                 print(f"Warning: Green mask coverage only {self.mask_stats['mask_percentage']:.1f}%, using full image")
                 return image_bgr, None
-            
-            roi_image = self.apply_roi_mask(image_bgr, mask)
-            return roi_image, mask
+
+            # Masked copy into a reused buffer: no 3-channel mask temporary
+            # and no fresh ROI image per frame. bitwise_and with mask= only
+            # writes covered pixels, so clear the buffer first.
+            if self._roi_buf is None or self._roi_buf.shape != image_bgr.shape:
+                self._roi_buf = np.empty_like(image_bgr)
+            self._roi_buf.fill(0)
+            cv2.bitwise_and(image_bgr, image_bgr, dst=self._roi_buf, mask=mask)
+            return self._roi_buf, mask
         else:
             return image_bgr, None
     
+    def get_roi_mask(self, image_bgr: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Get the green mask for masked reductions, without copying the image.
+
+        Unlike get_roi_image this never materializes a masked image; callers
+        pass the returned mask to OpenCV's mask= reductions and keep reading
+        the original buffer.
+
+        Args:
+            image_bgr: Input image in BGR format
+
+        Returns:
+            Binary mask, or None if masking is disabled or coverage is
+            insufficient (analyse the full image in that case)
+        """
+        if not self.use_green_mask:
+            return None
+
+        mask = self.get_pitch_mask(image_bgr)
+
+        if self.mask_stats['mask_percentage'] < 5.0:  # Less than 5% coverage
+            print(f"Warning: Green mask coverage only {self.mask_stats['mask_percentage']:.1f}%, using full image")
+            return None
+
+        return mask
+
     def get_mask_coverage_percentage(self) -> float:
         """Get the percentage of image covered by the mask."""
         return self.mask_stats['mask_percentage']
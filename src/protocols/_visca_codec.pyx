@@ -0,0 +1,44 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled VISCA codec hot path.
+
+Optional Cython extension for the per-command byte shuffling (VISCA-IP
+header build and 4-nibble response decode). Build in place with:
+
+    cythonize -i src/protocols/_visca_codec.pyx
+
+visca_codec.py falls back to pure Python when this module is not built.
+"""
+
+from libc.string cimport memcpy
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+
+
+def build_ip_packet(bytes payload, unsigned int sequence_number):
+    """Build a VISCA-IP packet (8-byte header + payload) for the given payload."""
+    cdef Py_ssize_t payload_length = len(payload)
+    cdef unsigned int msg_type = 0x0100  # Command
+    if payload_length >= 2 and (<unsigned char> payload[1]) == 0x09:
+        msg_type = 0x0110  # Inquiry
+
+    cdef bytes packet = PyBytes_FromStringAndSize(NULL, 8 + payload_length)
+    cdef unsigned char* buf = <unsigned char*> PyBytes_AS_STRING(packet)
+
+    buf[0] = (msg_type >> 8) & 0xFF
+    buf[1] = msg_type & 0xFF
+    buf[2] = (payload_length >> 8) & 0xFF
+    buf[3] = payload_length & 0xFF
+    buf[4] = (sequence_number >> 24) & 0xFF
+    buf[5] = (sequence_number >> 16) & 0xFF
+    buf[6] = (sequence_number >> 8) & 0xFF
+    buf[7] = sequence_number & 0xFF
+    memcpy(buf + 8, PyBytes_AS_STRING(payload), payload_length)
+
+    return packet
+
+
+def decode_4byte(bytes response):
+    """Decode the 4-nibble value from a 90 50 0p 0q 0r 0s FF inquiry reply."""
+    cdef const unsigned char* buf = <const unsigned char*> PyBytes_AS_STRING(response)
+    return ((buf[2] & 0x0F) << 12) | ((buf[3] & 0x0F) << 8) | \
+           ((buf[4] & 0x0F) << 4) | (buf[5] & 0x0F)
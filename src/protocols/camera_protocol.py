@@ -5,18 +5,129 @@ This module provides an abstraction layer for camera communication protocols,
 supporting both CGI (HTTP) and VISCA (UDP) protocols for camera control.
 """
 
+import functools
+import hashlib
 import json
+import logging
+import os
+import random
+import re
+import select
 import socket
 import time
 import requests
 from requests.auth import HTTPDigestAuth
 from abc import ABC, abstractmethod
+from urllib.parse import urlencode
 from typing import Dict, List, Union, Optional, Tuple, Any
+import itertools
 import struct
 import asyncio
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
+try:
+    import orjson  # Optional: 2-3x faster JSON parsing
+except ImportError:
+    orjson = None
+
+from . import visca_codec
+from .visca_codec import decode_4byte
+
+# Precompiled VISCA-IP header formats; struct.pack/unpack with a literal
+# format string re-parses the format on every call
+_VISCA_IP_HEADER = struct.Struct('>HHI')  # msg_type, payload_length, sequence
+_VISCA_IP_SEQ = struct.Struct('>I')       # sequence number at offset 4
+
+# Compiled parser for the camera's `var Name="Value";` inquiry body; one
+# C-level finditer pass over the raw bytes replaces the per-line
+# split/replace chains (and skips decoding the whole body to str)
+_CGI_VAR_RE = re.compile(rb'var\s+"?([^"=\s]+)"?\s*=\s*"?([^";\r\n]*)"?')
+
+# Reply classification on the folded 16-bit prefix: one compare against a
+# small set instead of separate byte and mask checks per reply
+_COMPLETION_PREFIXES = frozenset((0x9050, 0x9060))
+
+# Hot-path logging goes through a module logger with deferred %-formatting,
+# so per-command messages cost nothing unless the level is enabled
+logger = logging.getLogger('camera_protocol')
+
+
+@functools.lru_cache(maxsize=128)
+def _camera_addr(cam_id: int, venue_number: int, port: int) -> Tuple[str, int]:
+    """
+    Resolve the (ip, port) endpoint for a camera.
+
+    There are only a few dozen (cam_id, venue) pairs per deployment, so the
+    f-string formatting is memoised instead of rerun on every send.
+    """
+    return (f"192.168.{venue_number + 54}.5{cam_id}", port)
+
+
+def _backoff_delay(attempt: int, base: float, cap: float = 2.0) -> float:
+    """
+    Exponential back-off with jitter for retry attempt `attempt` (0-based).
+
+    The jitter spreads correlated retries out so simultaneous failures
+    across cameras do not storm back in lockstep.
+    """
+    return min(cap, base * (2 ** attempt)) * (0.5 + random.random() * 0.5)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_cached(config_file: str, mtime: float) -> Dict:
+    """Parse a JSON config file, cached on (path, mtime)."""
+    with open(config_file, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_config_cached(config_file: str) -> Dict:
+    """
+    Load and cache a JSON configuration file by path.
+
+    Protocol instances are typically created once per camera from the same
+    config file; caching at module scope avoids repeated disk reads and
+    JSON parses. The file's mtime is part of the cache key, so an edited
+    config is re-parsed while unchanged calls skip I/O entirely. Callers
+    must treat the returned dict as read-only.
+    """
+    import os
+    try:
+        mtime = os.path.getmtime(config_file)
+    except OSError:
+        return {}
+    return _parse_config_cached(os.path.abspath(config_file), mtime)
+
+
+def _encode_value_byte(value: int) -> bytes:
+    """Encode a value for 7-byte set prefixes (Iris/Gain/Shutter/ColorGain)."""
+    return bytes([value & 0xFF, 0xFF])
+
+
+def _encode_value_nibbles(value: int) -> bytes:
+    """Encode a value for 6-byte set prefixes (high nibble, low nibble)."""
+    return bytes([(value >> 4) & 0x0F, value & 0x0F, 0xFF])
+
+
+def _encode_value_clamped(value: int) -> bytes:
+    """Encode a value for single-byte set commands, clamped to nibble range."""
+    return bytes([min(max(value, 0), 15), 0xFF])
+
+
+class _LazyHex:
+    """Defer bytes.hex() until a log record is actually formatted."""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __str__(self):
+        return self._data.hex() if self._data else 'None'
+
 
 class CameraProtocolInterface(ABC):
     """Abstract base class for camera communication protocols."""
@@ -60,7 +171,19 @@ class CameraProtocolInterface(ABC):
 
 class CGIProtocol(CameraProtocolInterface):
     """CGI (HTTP) protocol implementation for camera communication."""
-    
+
+    # Fleet-shared sessions: every CGIProtocol instance reuses the same two
+    # sessions, so a multi-camera controller holds one connection pool with
+    # per-host keepalive entries instead of a pool per instance. Creation and
+    # refcounting happen in non-awaiting code, so no lock is needed.
+    _shared_session: Optional[ClientSession] = None
+    _shared_set_session: Optional[ClientSession] = None
+    # Loops owning the sessions above: a session whose loop has exited still
+    # reports closed == False, so rebuild decisions key on the loop too
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+    _set_session_loop: Optional[asyncio.AbstractEventLoop] = None
+    _session_refs: int = 0
+
     def __init__(self, config_file: str = None):
         """
         Initialize CGI protocol.
@@ -78,23 +201,150 @@ class CGIProtocol(CameraProtocolInterface):
         self.timeout = self.config.get('protocol', {}).get('cgi', {}).get('timeout', 2)
         self.max_attempts = self.config.get('protocol', {}).get('cgi', {}).get('max_attempts', 50)
         self.retry_delay = self.config.get('protocol', {}).get('cgi', {}).get('retry_delay', 1.0)
-    
+        self._base_urls = {}  # (cam_id, venue_number) -> (imaging_url, inquiry_url)
+
+        # Connection pool tuning; keepalive_timeout should match the camera's
+        # HTTP keep-alive idle window (30-60s on Sony SRG models) so bursts
+        # reuse connections instead of re-handshaking TCP
+        pool_config = self.config.get('protocol', {}).get('cgi', {}).get('pool', {})
+        self.pool_limit = pool_config.get('limit', 128)
+        self.pool_limit_per_host = pool_config.get('limit_per_host', 16)
+        self.keepalive_timeout = pool_config.get('keepalive_timeout', 60)
+        self.ttl_dns_cache = pool_config.get('ttl_dns_cache', 300)
+        # Max set-retry attempts in flight at once on the pipelined connection
+        self.pipeline_depth = pool_config.get('pipeline_depth', 4)
+
+
+        # Cached digest challenges per host, so only the first request (or a
+        # stale nonce) pays the 401 round-trip
+        self._digest_ctx: Dict[str, Dict[str, Any]] = {}
+
+    def _get_session(self) -> ClientSession:
+        """Get (or lazily create) the fleet-shared inquiry session."""
+        cls = CGIProtocol
+        loop = asyncio.get_running_loop()
+        if (cls._shared_session is None or cls._shared_session.closed
+                or cls._session_loop is not loop):
+            # Rebuild when the running loop changed (e.g. a new
+            # asyncio.run): the old session is bound to the dead loop and
+            # would raise "Event loop is closed" on use
+            cls._shared_session = ClientSession(
+                timeout=ClientTimeout(total=self.timeout),
+                connector=self._create_connector(),
+            )
+            cls._session_loop = loop
+        return cls._shared_session
+
+    def _get_set_session(self) -> ClientSession:
+        """Get (or lazily create) the fleet-shared single-connection set session."""
+        cls = CGIProtocol
+        loop = asyncio.get_running_loop()
+        if (cls._shared_set_session is None or cls._shared_set_session.closed
+                or cls._set_session_loop is not loop):
+            # One connection per camera host: aiohttp serializes each burst
+            # onto a keep-alive connection, so the attempts pipeline at the
+            # HTTP layer instead of opening a connection per retry. Rebuilt
+            # whenever the running loop changed, same as _get_session.
+            cls._shared_set_session = ClientSession(
+                timeout=ClientTimeout(total=self.timeout),
+                connector=TCPConnector(
+                    limit_per_host=1,
+                    force_close=False,
+                    keepalive_timeout=self.keepalive_timeout,
+                    enable_cleanup_closed=True,
+                ),
+            )
+            cls._set_session_loop = loop
+        return cls._shared_set_session
+
+    async def disconnect_async(self) -> bool:
+        """Release this instance's hold on the shared HTTP sessions."""
+        cls = CGIProtocol
+        if self.connected:
+            self.connected = False
+            cls._session_refs = max(0, cls._session_refs - 1)
+        if cls._session_refs == 0:
+            # Last instance out closes the fleet-shared sessions
+            for session in (cls._shared_session, cls._shared_set_session):
+                if session is not None and not session.closed:
+                    await session.close()
+            cls._shared_session = None
+            cls._shared_set_session = None
+            cls._session_loop = None
+            cls._set_session_loop = None
+        return True
+
+    @classmethod
+    def _close_shared_sessions(cls):
+        """Close the fleet-shared sessions from non-async code."""
+        for session, loop in ((cls._shared_session, cls._session_loop),
+                              (cls._shared_set_session, cls._set_session_loop)):
+            if session is None or session.closed:
+                continue
+            if loop is not None and not loop.is_closed():
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(session.close(), loop)
+                else:
+                    loop.run_until_complete(session.close())
+            # A closed owning loop cannot run the close coroutine any more;
+            # dropping the reference lets the connector be reclaimed
+        cls._shared_session = None
+        cls._shared_set_session = None
+        cls._session_loop = None
+        cls._set_session_loop = None
+
+    def _create_connector(self) -> TCPConnector:
+        """Create a TCP connector with the configured pool settings."""
+        return TCPConnector(
+            limit=self.pool_limit,
+            limit_per_host=self.pool_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def _get_base_urls(self, cam_id: int, venue_number: int) -> Tuple[str, str]:
+        """
+        Get precomputed imaging/inquiry base URLs for a camera.
+
+        Args:
+            cam_id: Camera ID (1-6)
+            venue_number: Venue number (1-15)
+
+        Returns:
+            Tuple of (imaging_url, inquiry_url)
+        """
+        key = (cam_id, venue_number)
+        urls = self._base_urls.get(key)
+        if urls is None:
+            host = f"192.168.{venue_number + 54}.5{cam_id}"
+            urls = (
+                f"http://{host}/command/imaging.cgi",
+                f"http://{host}/command/inquiry.cgi?inqjs=imaging",
+            )
+            self._base_urls[key] = urls
+        return urls
+
     def _load_config(self, config_file: str) -> Dict:
-        """Load configuration from JSON file."""
-        try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
-    
+        """Load configuration from JSON file (cached at module scope)."""
+        return _load_config_cached(config_file)
+
     def connect(self) -> bool:
         """CGI protocol doesn't require persistent connection."""
-        self.connected = True
+        if not self.connected:
+            self.connected = True
+            CGIProtocol._session_refs += 1
         return True
     
     def disconnect(self) -> bool:
         """CGI protocol doesn't require persistent connection."""
-        self.connected = False
+        cls = CGIProtocol
+        if self.connected:
+            self.connected = False
+            cls._session_refs = max(0, cls._session_refs - 1)
+        if cls._session_refs == 0:
+            # Last sync user out releases the shared sessions too
+            cls._close_shared_sessions()
         return True
     
     def is_connected(self) -> bool:
@@ -112,9 +362,8 @@ class CGIProtocol(CameraProtocolInterface):
         Returns:
             Dictionary of camera parameters or None if failed
         """
-        venue_number += 54
-        url = f'http://192.168.{venue_number}.5{cam_id}/command/inquiry.cgi?inqjs=imaging'
-        
+        _, url = self._get_base_urls(cam_id, venue_number)
+
         try:
             response = requests.get(
                 url, 
@@ -123,25 +372,17 @@ class CGIProtocol(CameraProtocolInterface):
             )
             
             if response.status_code != 200:
-                print(f"Failed to get camera params. Status code: {response.status_code}")
+                logger.warning("Failed to get camera params. Status code: %s", response.status_code)
                 return None
             
             # Parse response
-            config_dict = {}
-            lines = response.text.splitlines()
-            for line in lines:
-                if 'var ' in line and '=' in line:
-                    # Extract parameter name and value
-                    parts = line.split('=', 1)
-                    if len(parts) == 2:
-                        param_name = parts[0].replace('var ', '').replace('"', '').strip()
-                        param_value = parts[1].replace('"', '').replace(';', '').strip()
-                        config_dict[param_name] = param_value
-            
-            return config_dict
-            
+            return {
+                name.decode(): value.decode()
+                for name, value in _CGI_VAR_RE.findall(response.content)
+            }
+
         except requests.exceptions.RequestException as e:
-            print(f"Error getting camera params: {e}")
+            logger.warning("Error getting camera params: %s", e)
             return None
     
     def set_camera_params(self, cam_id: int, venue_number: int, params_dict: Dict[str, Union[int, str]]) -> bool:
@@ -159,10 +400,9 @@ class CGIProtocol(CameraProtocolInterface):
         if not params_dict:
             return True
         
-        venue_number += 54
-        params_string = "&".join(f"{k}={v}" for k, v in params_dict.items())
-        url = f'http://192.168.{venue_number}.5{cam_id}/command/imaging.cgi?{params_string}'
-        
+        imaging_url, _ = self._get_base_urls(cam_id, venue_number)
+        url = f"{imaging_url}?{urlencode(params_dict)}"
+
         for attempt in range(self.max_attempts):
             try:
                 response = requests.post(
@@ -172,20 +412,91 @@ class CGIProtocol(CameraProtocolInterface):
                 )
                 
                 if response.status_code == 200:
-                    print(f"Successfully set camera parameters on attempt {attempt + 1}")
+                    logger.debug("Successfully set camera parameters on attempt %s", attempt + 1)
                     return True
                 else:
-                    print(f"Failed to set camera parameters on attempt {attempt + 1}. Status code: {response.status_code}")
+                    logger.warning("Failed to set camera parameters on attempt %s. Status code: %s", attempt + 1, response.status_code)
                     
             except requests.exceptions.RequestException as e:
-                print(f"Error setting camera params on attempt {attempt + 1}: {e}")
+                logger.warning("Error setting camera params on attempt %s: %s", attempt + 1, e)
             
             if attempt < self.max_attempts - 1:
-                time.sleep(self.retry_delay)
+                time.sleep(_backoff_delay(attempt, self.retry_delay))
         
-        print(f"Failed to set camera parameters after {self.max_attempts} attempts")
+        logger.warning("Failed to set camera parameters after %s attempts", self.max_attempts)
         return False
     
+    def _store_digest_challenge(self, host: str, challenge: str) -> None:
+        """Parse a WWW-Authenticate digest challenge and cache it for a host."""
+        if not challenge.lower().startswith('digest'):
+            return
+        fields = {
+            key: quoted or bare
+            for key, quoted, bare in re.findall(r'(\w+)=(?:"([^"]*)"|([^",\s]+))', challenge)
+        }
+        if 'realm' not in fields or 'nonce' not in fields:
+            return
+        fields['nc'] = 0
+        # HA1 only depends on the realm; hash it once per challenge
+        fields['ha1'] = hashlib.md5(
+            f"{self.username}:{fields['realm']}:{self.password}".encode()
+        ).hexdigest()
+        self._digest_ctx[host] = fields
+
+    def _digest_header(self, host: str, method: str, url: str) -> Optional[str]:
+        """Build an Authorization header from the cached challenge, if any."""
+        ctx = self._digest_ctx.get(host)
+        if ctx is None:
+            return None
+        # uri is the path + query portion of the request target
+        _, _, uri = url.partition(host)
+        ha2 = hashlib.md5(f"{method}:{uri}".encode()).hexdigest()
+        nonce = ctx['nonce']
+        qop = ctx.get('qop', '')
+        if qop:
+            # Servers may offer "auth,auth-int"; plain auth is what CGI uses
+            qop = 'auth'
+            ctx['nc'] += 1
+            nc = f"{ctx['nc']:08x}"
+            cnonce = os.urandom(8).hex()
+            response = hashlib.md5(
+                f"{ctx['ha1']}:{nonce}:{nc}:{cnonce}:{qop}:{ha2}".encode()
+            ).hexdigest()
+            extra = f', qop={qop}, nc={nc}, cnonce="{cnonce}"'
+        else:
+            response = hashlib.md5(f"{ctx['ha1']}:{nonce}:{ha2}".encode()).hexdigest()
+            extra = ''
+        opaque = f', opaque="{ctx["opaque"]}"' if 'opaque' in ctx else ''
+        return (
+            f'Digest username="{self.username}", realm="{ctx["realm"]}", nonce="{nonce}", '
+            f'uri="{uri}", response="{response}", algorithm=MD5{extra}{opaque}'
+        )
+
+    async def _cgi_request(self, session: ClientSession, method: str, url: str) -> aiohttp.ClientResponse:
+        """
+        Issue a CGI request with cached digest authentication.
+
+        The first request to a host (or one hitting a stale nonce) pays the
+        401 challenge round-trip; subsequent requests send a locally computed
+        Authorization header and go through in a single exchange.
+        """
+        host = url.split('/')[2]
+        header = self._digest_header(host, method, url)
+        headers = {'Authorization': header} if header else None
+        response = await session.request(method, url, headers=headers)
+        if response.status == 401:
+            challenge = response.headers.get('WWW-Authenticate', '')
+            response.release()
+            self._store_digest_challenge(host, challenge)
+            header = self._digest_header(host, method, url)
+            if header is None:
+                # Camera did not offer digest; fall back to basic credentials
+                return await session.request(
+                    method, url, auth=aiohttp.BasicAuth(self.username, self.password)
+                )
+            response = await session.request(method, url, headers={'Authorization': header})
+        return response
+
     async def get_camera_params_async(self, cam_id: int, venue_number: int) -> Optional[Dict[str, str]]:
         """
         Get current camera parameters via CGI inquiry (async version).
@@ -197,38 +508,26 @@ class CGIProtocol(CameraProtocolInterface):
         Returns:
             Dictionary of camera parameters or None if failed
         """
-        venue_number += 54
-        url = f'http://192.168.{venue_number}.5{cam_id}/command/inquiry.cgi?inqjs=imaging'
-        
-        timeout = ClientTimeout(total=self.timeout)
-        connector = TCPConnector(limit=10, limit_per_host=5)
-        
-        async with ClientSession(timeout=timeout, connector=connector) as session:
-            try:
-                async with session.get(url, auth=aiohttp.BasicAuth(self.username, self.password)) as response:
-                    if response.status != 200:
-                        print(f"Failed to get camera params. Status code: {response.status}")
-                        return None
-                    
-                    text = await response.text()
-                    
-                    # Parse response
-                    config_dict = {}
-                    lines = text.splitlines()
-                    for line in lines:
-                        if 'var ' in line and '=' in line:
-                            # Extract parameter name and value
-                            parts = line.split('=', 1)
-                            if len(parts) == 2:
-                                param_name = parts[0].replace('var ', '').replace('"', '').strip()
-                                param_value = parts[1].replace('"', '').replace(';', '').strip()
-                                config_dict[param_name] = param_value
+        _, url = self._get_base_urls(cam_id, venue_number)
+
+        session = self._get_session()
+        try:
+            async with await self._cgi_request(session, 'GET', url) as response:
+                if response.status != 200:
+                    logger.warning("Failed to get camera params. Status code: %s", response.status)
+                    return None
                     
-                    return config_dict
+                body = await response.read()
+
+                # Parse response
+                return {
+                    name.decode(): value.decode()
+                    for name, value in _CGI_VAR_RE.findall(body)
+                }
                     
-            except aiohttp.ClientError as e:
-                print(f"Error getting camera params: {e}")
-                return None
+        except aiohttp.ClientError as e:
+            logger.warning("Error getting camera params: %s", e)
+            return None
     
     async def set_camera_params_async(self, cam_id: int, venue_number: int, params_dict: Dict[str, Union[int, str]]) -> bool:
         """
@@ -244,32 +543,56 @@ class CGIProtocol(CameraProtocolInterface):
         """
         if not params_dict:
             return True
-        
-        venue_number += 54
-        params_string = "&".join(f"{k}={v}" for k, v in params_dict.items())
-        url = f'http://192.168.{venue_number}.5{cam_id}/command/imaging.cgi?{params_string}'
-        
-        timeout = ClientTimeout(total=self.timeout)
-        connector = TCPConnector(limit=10, limit_per_host=5)
-        
-        async with ClientSession(timeout=timeout, connector=connector) as session:
-            for attempt in range(self.max_attempts):
+
+        imaging_url, _ = self._get_base_urls(cam_id, venue_number)
+        url = f"{imaging_url}?{urlencode(params_dict)}"
+
+        session = self._get_set_session()
+        # Bound in-flight attempts so retries don't amplify under fanout
+        in_flight = asyncio.Semaphore(self.pipeline_depth)
+
+        # Cumulative jittered start offsets: attempt i launches roughly when
+        # the old serial loop would have reached it, so the retry budget
+        # still spans the full horizon (the per-attempt backoff caps at 2 s,
+        # which would otherwise start every attempt within the first couple
+        # of seconds and burn all retries on one fast-failing burst)
+        offsets = [0.0]
+        for i in range(1, self.max_attempts):
+            offsets.append(offsets[-1] + _backoff_delay(i - 1, self.retry_delay))
+
+        async def attempt(index: int) -> bool:
+            if offsets[index]:
+                await asyncio.sleep(offsets[index])
+            async with in_flight:
                 try:
-                    async with session.post(url, auth=aiohttp.BasicAuth(self.username, self.password)) as response:
+                    async with await self._cgi_request(session, 'POST', url) as response:
                         if response.status == 200:
-                            print(f"Successfully set camera parameters on attempt {attempt + 1}")
+                            logger.debug("Successfully set camera parameters on attempt %s", index + 1)
                             return True
-                        else:
-                            print(f"Failed to set camera parameters on attempt {attempt + 1}. Status code: {response.status}")
-                            
+                        logger.warning("Failed to set camera parameters on attempt %s. Status code: %s", index + 1, response.status)
                 except aiohttp.ClientError as e:
-                    print(f"Error setting camera params on attempt {attempt + 1}: {e}")
-                
-                if attempt < self.max_attempts - 1:
-                    await asyncio.sleep(self.retry_delay)
-            
-            print(f"Failed to set camera parameters after {self.max_attempts} attempts")
-            return False
+                    logger.warning("Error setting camera params on attempt %s: %s", index + 1, e)
+                return False
+
+        tasks = [asyncio.create_task(attempt(i)) for i in range(self.max_attempts)]
+        success = False
+        try:
+            # Return on the first success instead of waiting out the
+            # remaining attempts' timeouts
+            for future in asyncio.as_completed(tasks):
+                if await future:
+                    success = True
+                    break
+        finally:
+            # First 200 wins; cancel the remaining attempts
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not success:
+            logger.warning("Failed to set camera parameters after %s attempts", self.max_attempts)
+        return success
 
 
 class VISCADatagramProtocol(asyncio.DatagramProtocol):
@@ -287,22 +610,26 @@ class VISCADatagramProtocol(asyncio.DatagramProtocol):
         """Handle incoming VISCA responses."""
         if len(data) > 8:
             visca_payload = data[8:]
-            sequence_number = struct.unpack('>I', data[4:8])[0]
+            sequence_number = _VISCA_IP_SEQ.unpack_from(data, 4)[0]
             
-            tracker = self.visca_protocol.command_futures.get(sequence_number)
-            if tracker:
+            # Single ring-slot access: resolve the slot index once instead of
+            # going through _tracker_for and _unregister_tracker separately
+            protocol = self.visca_protocol
+            index = sequence_number & protocol._ring_mask
+            tracker = protocol._tracker_ring[index]
+            if tracker is not None and tracker.sequence_number == sequence_number:
                 tracker.handle_response(visca_payload)
                 if tracker.is_complete():
-                    self.visca_protocol.command_futures.pop(sequence_number, None)
+                    protocol._tracker_ring[index] = None
     
     def error_received(self, exc):
         """Handle protocol errors."""
-        print(f"VISCA datagram protocol error: {exc}")
+        logger.warning("VISCA datagram protocol error: %s", exc)
     
     def connection_lost(self, exc):
         """Called when connection is lost."""
         if exc:
-            print(f"VISCA datagram protocol connection lost: {exc}")
+            logger.warning("VISCA datagram protocol connection lost: %s", exc)
 
 
 class RateLimiter:
@@ -311,31 +638,46 @@ class RateLimiter:
     def __init__(self, max_requests_per_second: int):
         self.max_requests = max_requests_per_second
         self.tokens = max_requests_per_second
-        self.last_update = time.time()
-        self.lock = asyncio.Lock()
+        # Monotonic clock: immune to NTP steps that would make elapsed time
+        # negative and break the bucket
+        self.last_update = time.monotonic()
     
     async def acquire(self):
         """Acquire a token, waiting if necessary."""
-        async with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.max_requests, self.tokens + elapsed * self.max_requests)
-            self.last_update = now
-            
-            if self.tokens >= 1:
-                self.tokens -= 1
-                return
-            
-            wait_time = (1 - self.tokens) / self.max_requests
-            await asyncio.sleep(wait_time)
-            self.tokens = 0
+        # No lock needed: asyncio is cooperative, so the read-modify-write
+        # below cannot be interrupted between non-awaiting statements. The
+        # common case returns without suspending at all.
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.tokens = min(self.max_requests, self.tokens + elapsed * self.max_requests)
+        self.last_update = now
+        
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return
+        
+        # Claim the deficit before sleeping so concurrent waiters queue up
+        # behind this one instead of recomputing the same wait
+        wait_time = (1 - self.tokens) / self.max_requests
+        self.tokens -= 1
+        await asyncio.sleep(wait_time)
 
 
 class CommandTracker:
     """Track ACK and completion responses for a VISCA command sequence."""
 
+    # One tracker is allocated per command; slots drop the per-instance
+    # __dict__ and make attribute access on the receive path cheaper
+    __slots__ = (
+        'sequence_number', 'expect_completion',
+        'ack_future', 'completion_future',
+        'ack_payload', 'completion_payload',
+    )
+
     def __init__(self, sequence_number: int, expect_completion: bool):
-        loop = asyncio.get_event_loop()
+        # Trackers are only built inside coroutines; get_running_loop is the
+        # documented fast path and skips the policy lookup of get_event_loop
+        loop = asyncio.get_running_loop()
         self.sequence_number = sequence_number
         self.expect_completion = expect_completion
         self.ack_future: asyncio.Future = loop.create_future()
@@ -345,10 +687,10 @@ class CommandTracker:
 
     @staticmethod
     def _is_completion(payload: bytes) -> bool:
-        if len(payload) < 2 or payload[0] != 0x90:
+        if len(payload) < 2:
             return False
-        response_type = payload[1] & 0xF0
-        return response_type in (0x50, 0x60)
+        prefix = (payload[0] << 8) | payload[1]
+        return (prefix & 0xFFF0) in _COMPLETION_PREFIXES
 
     def handle_response(self, payload: bytes):
         """Resolve any pending futures based on the incoming payload."""
@@ -372,13 +714,41 @@ class CommandTracker:
             and not self.completion_future.cancelled()
         )
 
+    @staticmethod
+    async def _await_with_timeout(future: asyncio.Future, timeout: float) -> bytes:
+        """
+        Await a future with a manual call_later timeout.
+
+        asyncio.wait_for wraps its argument in an extra task per call; with
+        sub-second VISCA timeouts firing dozens of times per poll, a plain
+        timer handle that cancels the future is measurably cheaper.
+        """
+        loop = future.get_loop()
+        timed_out = False
+
+        def _on_timeout():
+            nonlocal timed_out
+            timed_out = True
+            if not future.done():
+                future.cancel()
+
+        handle = loop.call_later(timeout, _on_timeout)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if timed_out:
+                raise asyncio.TimeoutError() from None
+            raise
+        finally:
+            handle.cancel()
+
     async def wait_for_ack(self, timeout: float) -> bytes:
-        return await asyncio.wait_for(self.ack_future, timeout=timeout)
+        return await self._await_with_timeout(self.ack_future, timeout)
 
     async def wait_for_completion(self, timeout: float) -> Optional[bytes]:
         if not self.expect_completion or self.completion_future is None:
             return self.ack_payload
-        return await asyncio.wait_for(self.completion_future, timeout=timeout)
+        return await self._await_with_timeout(self.completion_future, timeout)
 
     def cancel(self):
         if not self.ack_future.done():
@@ -421,10 +791,43 @@ class VISCAProtocol(CameraProtocolInterface):
         
         # VISCA-IP header management
         self.sequence_number = 0  # Sequence number for VISCA-IP header
+        self._rx_buf = bytearray(1024)  # Reusable sync receive buffer
+        self._next_send_at = 0.0  # Shared leaky-bucket pacing schedule
+        # Bound C-level counter; one call per send replaces the
+        # read-add-store sequence on the instance attribute
+        self._next_seq = itertools.count(1).__next__
+        self._packet_buf = bytearray(24)  # Reusable scratch buffer for packet builds
         
         # VISCA command mappings
         self.command_map = self._initialize_command_map()
-        
+
+        # Inquiry payloads are constant bytes; build them once instead of on
+        # every poll. Set commands cache their opcode prefix so only the value
+        # bytes are appended per send.
+        self._inquiry_payloads = {
+            name: self._create_visca_packet(cmds['inquiry'])
+            for name, cmds in self.command_map.items() if 'inquiry' in cmds
+        }
+        self._set_prefixes = {}
+        for name, cmds in self.command_map.items():
+            if 'set' not in cmds:
+                continue
+            prefix = cmds['set'][:-1] if cmds['set'].endswith(b'\xFF') else cmds['set']
+            # Pick the value encoder once per parameter so the per-send path
+            # is a single dict lookup plus two bytes concatenations
+            if len(prefix) == 7:
+                encoder = _encode_value_byte
+            elif len(prefix) == 6:
+                encoder = _encode_value_nibbles
+            else:
+                encoder = _encode_value_clamped
+            self._set_prefixes[name] = (prefix, encoder)
+
+        # Frozen membership sets: one hashed intersection per call replaces
+        # the per-parameter nested command_map lookups
+        self._settable_params = frozenset(self._set_prefixes)
+        self._inquiry_params = frozenset(self._inquiry_payloads)
+
         # Load concurrency configuration
         visca_config = self.config.get('protocol', {}).get('visca', {})
         self.concurrency_config = visca_config.get('concurrency', {})
@@ -448,14 +851,28 @@ class VISCAProtocol(CameraProtocolInterface):
         
         # Semaphore for controlled concurrency
         self.concurrency_semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        # Wait for Completion after ACK on set commands. Control loops re-issue
+        # every frame anyway, so ACK-only halves per-parameter latency.
+        self.require_completion = visca_config.get('require_completion', False)
+
+        # Debounce window for coalescing rapid set updates (default 20ms = 1V at 50p);
+        # debounce_sets routes set_camera_params_async through the queue
+        self.coalesce_ms = visca_config.get('coalesce_ms', 20)
+        self.debounce_sets = visca_config.get('debounce_sets', False)
+        self._pending_sets = {}  # (cam_id, venue_number, param_name) -> [value, handle]
+        self._flush_tasks = set()  # in-flight flushed sets, kept alive until done
         
         # Track failure rate for adaptive concurrency
         self.failure_count = 0
         self.success_count = 0
         self.current_concurrency_limit = self.max_concurrent
         
-        # Async support
-        self.command_futures = {}  # Track pending CommandTracker objects by sequence number
+        # Async support: pending CommandTracker objects live in a fixed-size
+        # ring indexed by sequence number & mask; O(1) array indexing replaces
+        # dict hashing/resize on the hot UDP receive path
+        self._tracker_ring = [None] * 1024
+        self._ring_mask = 1023
         self.datagram_protocol = None
         self.transport = None
     
@@ -474,35 +891,62 @@ class VISCAProtocol(CameraProtocolInterface):
         Returns:
             Complete VISCA-IP packet (header + payload)
         """
-        # Increment sequence number
-        self.sequence_number = (self.sequence_number + 1) & 0xFFFFFFFF
-        
+        # Increment sequence number (masked to the 32-bit header field)
+        self.sequence_number = self._next_seq() & 0xFFFFFFFF
+
+        if visca_codec.HAVE_NATIVE:
+            return visca_codec.build_ip_packet(visca_payload, self.sequence_number)
+
         # Determine message type based on payload (0x09 = inquiry, 0x01 = command)
         if len(visca_payload) >= 2 and visca_payload[1] == 0x09:
             msg_type = 0x0110  # Inquiry
         else:
             msg_type = 0x0100  # Command
         
-        # Build header
+        # Build header + payload in a reusable scratch buffer
         payload_length = len(visca_payload)
-        header = struct.pack('>HHI', msg_type, payload_length, self.sequence_number)
-        
-        return header + visca_payload
+        total_length = 8 + payload_length
+        buf = self._packet_buf
+        if len(buf) < total_length:
+            buf = self._packet_buf = bytearray(total_length)
+        _VISCA_IP_HEADER.pack_into(buf, 0, msg_type, payload_length, self.sequence_number)
+        buf[8:total_length] = visca_payload
+
+        return bytes(buf[:total_length])
     
+    def _register_tracker(self, tracker: 'CommandTracker'):
+        """Register a pending command tracker in the ring, evicting stale entries."""
+        index = tracker.sequence_number & self._ring_mask
+        stale = self._tracker_ring[index]
+        if stale is not None:
+            stale.cancel()
+        self._tracker_ring[index] = tracker
+
+    def _unregister_tracker(self, sequence_number: int):
+        """Clear a tracker slot if it still belongs to the given sequence number."""
+        index = sequence_number & self._ring_mask
+        tracker = self._tracker_ring[index]
+        if tracker is not None and tracker.sequence_number == sequence_number:
+            self._tracker_ring[index] = None
+
+    def _tracker_for(self, sequence_number: int) -> Optional['CommandTracker']:
+        """Look up the pending tracker for a sequence number, rejecting stale slots."""
+        tracker = self._tracker_ring[sequence_number & self._ring_mask]
+        if tracker is not None and tracker.sequence_number == sequence_number:
+            return tracker
+        return None
+
     def _clear_pending_sequences(self):
         """Cancel all pending command trackers."""
-        for tracker in self.command_futures.values():
-            tracker.cancel()
-        self.command_futures.clear()
+        for index, tracker in enumerate(self._tracker_ring):
+            if tracker is not None:
+                tracker.cancel()
+                self._tracker_ring[index] = None
     
     def _load_config(self, config_file: str) -> Dict:
-        """Load configuration from JSON file."""
-        try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
-    
+        """Load configuration from JSON file (cached at module scope)."""
+        return _load_config_cached(config_file)
+
     def _initialize_command_map(self) -> Dict[str, Dict[str, bytes]]:
         """
         Initialize VISCA command mappings for Sony SRG-XB25/SRG-XP1.
@@ -531,6 +975,24 @@ class VISCAProtocol(CameraProtocolInterface):
             }
         }
     
+    @staticmethod
+    def _tune_socket_buffers(sock) -> None:
+        """
+        Enlarge the UDP socket buffers for reply bursts.
+
+        The Linux default (~208KB) can drop replies when six cameras answer a
+        burst at once, and every lost datagram costs a full retry round. Best
+        effort: the kernel caps the value at net.core.rmem_max/wmem_max.
+        """
+        for name, opt in (('SO_RCVBUF', socket.SO_RCVBUF), ('SO_SNDBUF', socket.SO_SNDBUF)):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, opt, 2 << 20)
+                # Report what the kernel actually granted (capped at
+                # rmem_max/wmem_max) so undersized deployments are visible
+                logger.debug("VISCA: %s effective size %s", name, sock.getsockopt(socket.SOL_SOCKET, opt))
+            except OSError:
+                pass
+
     def connect(self) -> bool:
         """
         Establish UDP connection for VISCA protocol (sync version).
@@ -539,17 +1001,21 @@ class VISCAProtocol(CameraProtocolInterface):
         try:
             if self.socket is None:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._tune_socket_buffers(self.socket)
                 # Don't bind to specific port - let OS assign ephemeral port
                 # This allows multiple camera instances to run simultaneously
                 # Camera will reply to whatever source port we use
-                self.socket.settimeout(self.timeout)
+                # Non-blocking once at setup; receives go through select in
+                # _recv_with_deadline, avoiding the per-call fcntl toggle that
+                # settimeout performs
+                self.socket.setblocking(False)
                 self.connected = True
                 # Get the assigned port for logging
                 local_port = self.socket.getsockname()[1] if self.socket.getsockname()[1] != 0 else "auto"
-                print(f"VISCA: Created UDP socket (local port: {local_port}) for send+recv")
+                logger.info("VISCA: Created UDP socket (local port: %s) for send+recv", local_port)
             return True
         except Exception as e:
-            print(f"VISCA: Failed to create socket: {e}")
+            logger.warning("VISCA: Failed to create socket: %s", e)
             return False
     
     async def connect_async(self) -> bool:
@@ -565,12 +1031,15 @@ class VISCAProtocol(CameraProtocolInterface):
                     lambda: self.datagram_protocol,
                     local_addr=('0.0.0.0', 0)  # Let OS assign port
                 )
+                sock = self.transport.get_extra_info('socket')
+                if sock is not None:
+                    self._tune_socket_buffers(sock)
                 self.connected = True
                 local_addr = self.transport.get_extra_info('sockname')
-                print(f"VISCA: Created async UDP endpoint (local port: {local_addr[1]}) for send+recv")
+                logger.info("VISCA: Created async UDP endpoint (local port: %s) for send+recv", local_addr[1])
             return True
         except Exception as e:
-            print(f"VISCA: Failed to create async socket: {e}")
+            logger.warning("VISCA: Failed to create async socket: %s", e)
             return False
     
     def disconnect(self) -> bool:
@@ -582,7 +1051,7 @@ class VISCAProtocol(CameraProtocolInterface):
             self.connected = False
             return True
         except Exception as e:
-            print(f"Error closing VISCA socket: {e}")
+            logger.warning("Error closing VISCA socket: %s", e)
             return False
     
     async def disconnect_async(self) -> bool:
@@ -595,7 +1064,7 @@ class VISCAProtocol(CameraProtocolInterface):
             self.connected = False
             return True
         except Exception as e:
-            print(f"Error closing VISCA async socket: {e}")
+            logger.warning("Error closing VISCA async socket: %s", e)
             return False
     
     def is_connected(self) -> bool:
@@ -647,6 +1116,35 @@ class VISCAProtocol(CameraProtocolInterface):
         
         return packet
     
+    def _set_payload(self, param_name: str, value: int) -> bytes:
+        """
+        Build a set-command payload from the cached opcode prefix.
+
+        Args:
+            param_name: Parameter to set
+            value: Integer parameter value
+
+        Returns:
+            Complete VISCA set payload (prefix + value bytes + terminator)
+        """
+        prefix, encoder = self._set_prefixes[param_name]
+        return prefix + encoder(value)
+    
+    def _recv_with_deadline(self, timeout: float) -> bytes:
+        """
+        Receive one datagram within `timeout` seconds via select.
+
+        Raises:
+            socket.timeout: If no datagram arrives in time
+        """
+        ready, _, _ = select.select([self.socket], [], [], timeout)
+        if not ready:
+            raise socket.timeout()
+        # recvfrom_into reuses the scratch buffer instead of allocating a
+        # fresh oversized bytes object per datagram
+        length, _ = self.socket.recvfrom_into(self._rx_buf)
+        return bytes(memoryview(self._rx_buf)[:length])
+
     def _send_visca_command(self, cam_id: int, venue_number: int, command: bytes) -> Optional[bytes]:
         """
         Send VISCA command with VISCA-IP header and receive response.
@@ -659,12 +1157,14 @@ class VISCAProtocol(CameraProtocolInterface):
         Returns:
             VISCA payload response (header stripped) or None if failed
         """
-        if not self.is_connected():
-            print(f"VISCA not connected for camera {cam_id}")
+        sock = self.socket
+        if sock is None or not self.connected:
+            logger.warning("VISCA not connected for camera %s", cam_id)
             return None
         
-        venue_number += 54
-        camera_ip = f"192.168.{venue_number}.5{cam_id}"
+        # Bind hot attributes once; the retry loop below only touches locals
+        camera_addr = _camera_addr(cam_id, venue_number, self.port)
+        sendto = sock.sendto
         
         for attempt in range(self.max_attempts):
             try:
@@ -672,18 +1172,31 @@ class VISCAProtocol(CameraProtocolInterface):
                 packet = self._build_visca_ip_packet(command)
                 
                 # Send packet
-                self.socket.sendto(packet, (camera_ip, self.port))
-                
-                # Receive response (VISCA-IP header + VISCA payload)
-                response, _ = self.socket.recvfrom(1024)
+                sendto(packet, camera_addr)
+                sent_sequence = self.sequence_number
                 
-                # Skip VISCA-IP header (8 bytes) and return VISCA payload
-                if len(response) > 8:
+                # Receive until the reply for this command arrives; replies
+                # carrying another sequence number (late answers to earlier
+                # commands) are discarded instead of being misattributed
+                deadline = time.monotonic() + self.timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise socket.timeout()
+                    response = self._recv_with_deadline(remaining)
+                    
+                    if len(response) <= 8:
+                        continue
+                    if _VISCA_IP_SEQ.unpack_from(response, 4)[0] != sent_sequence:
+                        continue
+                    
+                    # Skip VISCA-IP header (8 bytes) and return VISCA payload
                     visca_payload = response[8:]
                     
                     # Validate VISCA response
                     if len(visca_payload) >= 3 and visca_payload[0] == self.reply_header:
                         return visca_payload
+                    break
                 
                 # Pace between attempts
                 if attempt < self.max_attempts - 1:
@@ -693,10 +1206,10 @@ class VISCAProtocol(CameraProtocolInterface):
                 if attempt < self.max_attempts - 1:
                     time.sleep(self.v_cycle)
                 else:
-                    print(f"VISCA timeout for camera {cam_id} after {self.max_attempts} attempts")
+                    logger.warning("VISCA timeout for camera %s after %s attempts", cam_id, self.max_attempts)
                     return None
             except Exception as e:
-                print(f"VISCA error for camera {cam_id}: {e}")
+                logger.warning("VISCA error for camera %s: %s", cam_id, e)
                 if attempt < self.max_attempts - 1:
                     time.sleep(self.v_cycle)
                 else:
@@ -717,46 +1230,15 @@ class VISCAProtocol(CameraProtocolInterface):
         """
         config_dict = {}
         
-        # Clear any stale responses from socket buffer
-        self.socket.setblocking(False)
-        try:
-            while True:
-                self.socket.recvfrom(1024)
-        except:
-            pass
-        self.socket.setblocking(True)
-        self.socket.settimeout(self.timeout)
-        
         for param_name, commands in self.command_map.items():
             if 'inquiry' in commands:
-                command = self._create_visca_packet(commands['inquiry'])
-                response = self._send_visca_command(cam_id, venue_number, command)
+                response = self._send_visca_command(cam_id, venue_number, self._inquiry_payloads[param_name])
                 
-                if response and len(response) >= 3:
-                    # Parse Sony VISCA response format: 0x90 0x50 [values] 0xFF
-                    if response[0] == 0x90 and response[1] == 0x50:
-                        if len(response) == 4:  # Single byte response (DigitalBrightLevel): 90 50 0X FF
-                            value = response[2]
-                            config_dict[param_name] = str(value)
-                            print(f"VISCA: Got {param_name}={value} from camera {cam_id}")
-                        elif len(response) == 7:  # Four byte response: 90 50 0p 0q 0r 0s FF
-                            # Format for Iris, Gain, Shutter, ColorSaturation (4 nibbles)
-                            p = response[2] & 0x0F
-                            q = response[3] & 0x0F
-                            r = response[4] & 0x0F
-                            s = response[5] & 0x0F
-                            value = (p << 12) | (q << 8) | (r << 4) | s
-                            config_dict[param_name] = str(value)
-                            print(f"VISCA: Got {param_name}={value} from camera {cam_id}")
-                        else:
-                            print(f"VISCA: Unexpected response length ({len(response)}) for {param_name}: {response.hex()}")
-                            config_dict[param_name] = "0"
-                    else:
-                        print(f"VISCA: Unexpected response format for {param_name}: {response.hex()}")
-                        config_dict[param_name] = "0"
-                else:
-                    print(f"VISCA: Failed to get {param_name} from camera {cam_id}")
-                    config_dict[param_name] = "0"
+                value = self._parse_inquiry_response(param_name, response, cam_id) if response else None
+                if value is None:
+                    logger.warning("VISCA: Failed to get %s from camera %s", param_name, cam_id)
+                    value = "0"
+                config_dict[param_name] = value
         
         return config_dict if config_dict else None
     
@@ -777,56 +1259,64 @@ class VISCAProtocol(CameraProtocolInterface):
         
         success_count = 0
         total_params = len(params_dict)
-        
-        for param_name, value in params_dict.items():
-            if param_name in self.command_map and 'set' in self.command_map[param_name]:
-                try:
-                    # Convert value to integer
-                    int_value = int(value)
-                    
-                    # Create command packet
-                    command = self._create_visca_packet(
-                        self.command_map[param_name]['set'], 
-                        int_value
-                    )
-                    
-                    print(f"VISCA: Setting {param_name}={int_value} on camera {cam_id} (hex: {command.hex()})")
-                    
-                    # Send command
-                    response = self._send_visca_command(cam_id, venue_number, command)
-                    
-                    if response and len(response) >= 3:
-                        # For SET commands: expect ACK (0x90 0x4z FF) then Completion (0x90 0x5z FF)
-                        if response[0] == 0x90 and (response[1] & 0xF0) == 0x40:  # Got ACK
-                            # Wait for Completion
-                            try:
-                                completion, _ = self.socket.recvfrom(1024)
-                                if len(completion) > 8:
-                                    comp_payload = completion[8:]
-                                    if comp_payload[0] == 0x90 and (comp_payload[1] & 0xF0) == 0x50:
-                                        print(f"VISCA: Successfully set {param_name}={int_value} on camera {cam_id}")
-                                        success_count += 1
-                                    else:
-                                        print(f"VISCA: Unexpected completion for {param_name}: {comp_payload.hex()}")
-                            except Exception as e:
-                                print(f"VISCA: No completion for {param_name}: {e}")
-                        elif response[0] == 0x90 and (response[1] & 0xF0) == 0x50:  # Direct completion
-                            print(f"VISCA: Successfully set {param_name}={int_value} on camera {cam_id}")
+
+        # Pre-resolve command templates and value conversions once, so the
+        # send loop below only does packet build + I/O per parameter
+        settable = params_dict.keys() & self._settable_params
+        for param_name in params_dict.keys() - settable:
+            logger.warning("VISCA: Unknown parameter %s", param_name)
+        plan = []
+        for param_name in settable:
+            try:
+                plan.append((param_name, int(params_dict[param_name])))
+            except ValueError:
+                logger.warning("VISCA: Invalid value for %s: %s", param_name, params_dict[param_name])
+
+        for param_name, int_value in plan:
+            try:
+                # Create command packet
+                command = self._set_payload(param_name, int_value)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("VISCA: Setting %s=%s on camera %s (hex: %s)", param_name, int_value, cam_id, command.hex())
+
+                # Send command
+                response = self._send_visca_command(cam_id, venue_number, command)
+
+                if response and len(response) >= 3:
+                    # For SET commands: expect ACK (0x90 0x4z FF) then Completion (0x90 0x5z FF)
+                    if response.startswith(b'\x90') and response[1] >> 4 == 0x4:  # Got ACK
+                        if not self.require_completion:
+                            # Fire-and-forget: ACK is enough, Completion arrives later
+                            # and is drained with other stale responses
+                            logger.debug("VISCA: Set %s=%s on camera %s (ACK only)", param_name, int_value, cam_id)
                             success_count += 1
-                        else:
-                            print(f"VISCA: Failed to set {param_name} on camera {cam_id}, response: {response.hex()}")
+                            continue
+                        # Wait for Completion
+                        try:
+                            completion = self._recv_with_deadline(self.timeout)
+                            if len(completion) > 8:
+                                comp_payload = completion[8:]
+                                if comp_payload[0] == 0x90 and (comp_payload[1] & 0xF0) == 0x50:
+                                    logger.debug("VISCA: Successfully set %s=%s on camera %s", param_name, int_value, cam_id)
+                                    success_count += 1
+                                else:
+                                    logger.warning("VISCA: Unexpected completion for %s: %s", param_name, _LazyHex(comp_payload))
+                        except Exception as e:
+                            logger.warning("VISCA: No completion for %s: %s", param_name, e)
+                    elif response.startswith(b'\x90') and response[1] >> 4 == 0x5:  # Direct completion
+                        logger.debug("VISCA: Successfully set %s=%s on camera %s", param_name, int_value, cam_id)
+                        success_count += 1
                     else:
-                        print(f"VISCA: No response for {param_name} on camera {cam_id}")
-                        
-                except ValueError:
-                    print(f"VISCA: Invalid value for {param_name}: {value}")
-                except Exception as e:
-                    print(f"VISCA: Error setting {param_name} on camera {cam_id}: {e}")
-            else:
-                print(f"VISCA: Unknown parameter {param_name}")
-        
-        success_rate = success_count / total_params if total_params > 0 else 0
-        print(f"VISCA: Set {success_count}/{total_params} parameters successfully on camera {cam_id}")
+                        logger.warning("VISCA: Failed to set %s on camera %s, response: %s", param_name, cam_id, _LazyHex(response))
+                else:
+                    logger.warning("VISCA: No response for %s on camera %s", param_name, cam_id)
+
+            except Exception as e:
+                logger.warning("VISCA: Error setting %s on camera %s: %s", param_name, cam_id, e)
+
+
+        logger.debug("VISCA: Set %s/%s parameters successfully on camera %s", success_count, total_params, cam_id)
         
         # Return True if at least some parameters were set successfully (not requiring ALL)
         return success_count > 0
@@ -850,49 +1340,53 @@ class VISCAProtocol(CameraProtocolInterface):
             Tuple of (first response payload, CommandTracker) or (None, None) if failed
         """
         if not self.is_connected():
-            print(f"VISCA not connected for camera {cam_id}")
+            logger.warning("VISCA not connected for camera %s", cam_id)
             return None, None
         
-        venue_number += 54
-        camera_ip = f"192.168.{venue_number}.5{cam_id}"
+        # Bind hot attributes once; the attempt loop runs on locals
+        camera_addr = _camera_addr(cam_id, venue_number, self.port)
+        sendto = self.transport.sendto
+        build_packet = self._build_visca_ip_packet
         
         for attempt in range(self.max_attempts):
             tracker: Optional[CommandTracker] = None
             try:
-                packet = self._build_visca_ip_packet(command)
-                sequence_number = struct.unpack('>I', packet[4:8])[0]
+                packet = build_packet(command)
+                # _build_visca_ip_packet just stamped self.sequence_number into
+                # the header, so reuse the counter instead of decoding the packet
+                sequence_number = self.sequence_number
                 tracker = CommandTracker(sequence_number, expect_completion)
-                self.command_futures[sequence_number] = tracker
+                self._register_tracker(tracker)
 
-                self.transport.sendto(packet, (camera_ip, self.port))
+                sendto(packet, camera_addr)
 
                 try:
                     response = await tracker.wait_for_ack(self.timeout)
                     if len(response) >= 3 and response[0] == self.reply_header:
                         if not expect_completion:
-                            self.command_futures.pop(sequence_number, None)
+                            self._unregister_tracker(sequence_number)
                             return response, None
                         return response, tracker
 
-                    print(f"VISCA: Unexpected response for camera {cam_id}: {response.hex() if response else 'None'}")
-                    self.command_futures.pop(sequence_number, None)
+                    logger.warning("VISCA: Unexpected response for camera %s: %s", cam_id, _LazyHex(response))
+                    self._unregister_tracker(sequence_number)
                     tracker.cancel()
 
                 except asyncio.TimeoutError:
-                    print(f"VISCA timeout for camera {cam_id} on attempt {attempt + 1}")
-                    self.command_futures.pop(sequence_number, None)
+                    logger.warning("VISCA timeout for camera %s on attempt %s", cam_id, attempt + 1)
+                    self._unregister_tracker(sequence_number)
                     tracker.cancel()
 
                 if tracker.is_complete():
-                    self.command_futures.pop(sequence_number, None)
+                    self._unregister_tracker(sequence_number)
 
                 if attempt < self.max_attempts - 1:
                     await asyncio.sleep(self.v_cycle)
                 
             except Exception as e:
-                print(f"VISCA error for camera {cam_id}: {e}")
+                logger.warning("VISCA error for camera %s: %s", cam_id, e)
                 if tracker is not None:
-                    self.command_futures.pop(tracker.sequence_number, None)
+                    self._unregister_tracker(tracker.sequence_number)
                     tracker.cancel()
                 if attempt < self.max_attempts - 1:
                     await asyncio.sleep(self.v_cycle)
@@ -909,162 +1403,242 @@ class VISCAProtocol(CameraProtocolInterface):
             int_value = int(value)
             
             # Create command packet
-            command = self._create_visca_packet(
-                self.command_map[param_name]['set'], 
-                int_value
-            )
+            command = self._set_payload(param_name, int_value)
             
-            print(f"VISCA: Setting {param_name}={int_value} on camera {cam_id}")
+            logger.debug("VISCA: Setting %s=%s on camera %s", param_name, int_value, cam_id)
             
             # Send command and wait for ACK/completion
             response, tracker = await self._send_visca_command_async(
-                cam_id, venue_number, command, expect_completion=True
+                cam_id, venue_number, command, expect_completion=self.require_completion
             )
-            
+
             tracker_sequence = tracker.sequence_number if tracker else None
             try:
                 if response and len(response) >= 3:
                     # For SET commands: expect ACK (0x90 0x4z FF) then Completion (0x90 0x5z FF)
-                    if response[0] == 0x90 and (response[1] & 0xF0) == 0x40:  # Got ACK
+                    if response.startswith(b'\x90') and response[1] >> 4 == 0x4:  # Got ACK
+                        if not self.require_completion:
+                            # Fire-and-forget: ACK is enough; the Completion datagram
+                            # arrives later and is dropped as an unknown sequence number
+                            logger.debug("VISCA: Set %s=%s on camera %s (ACK only)", param_name, int_value, cam_id)
+                            return True
                         # Wait for Completion
                         try:
                             completion = await tracker.wait_for_completion(self.timeout) if tracker else None
-                            if completion and completion[0] == 0x90 and (completion[1] & 0xF0) == 0x50:
-                                print(f"VISCA: Successfully set {param_name}={int_value} on camera {cam_id}")
+                            if completion and completion.startswith(b'\x90') and completion[1] >> 4 == 0x5:
+                                logger.debug("VISCA: Successfully set %s=%s on camera %s", param_name, int_value, cam_id)
                                 return True
                             else:
-                                print(f"VISCA: Unexpected completion for {param_name}: {completion.hex() if completion else 'None'}")
+                                logger.warning("VISCA: Unexpected completion for %s: %s", param_name, _LazyHex(completion))
                         except Exception as e:
-                            print(f"VISCA: No completion for {param_name}: {e}")
+                            logger.warning("VISCA: No completion for %s: %s", param_name, e)
                             if tracker:
                                 tracker.cancel()
-                    elif response[0] == 0x90 and (response[1] & 0xF0) == 0x50:  # Direct completion
-                        print(f"VISCA: Successfully set {param_name}={int_value} on camera {cam_id}")
+                    elif response.startswith(b'\x90') and response[1] >> 4 == 0x5:  # Direct completion
+                        logger.debug("VISCA: Successfully set %s=%s on camera %s", param_name, int_value, cam_id)
                         return True
                     else:
-                        print(f"VISCA: Failed to set {param_name} on camera {cam_id}, response: {response.hex()}")
+                        logger.warning("VISCA: Failed to set %s on camera %s, response: %s", param_name, cam_id, _LazyHex(response))
                 else:
-                    print(f"VISCA: No response for {param_name} on camera {cam_id}")
+                    logger.warning("VISCA: No response for %s on camera %s", param_name, cam_id)
             finally:
                 if tracker_sequence is not None:
-                    self.command_futures.pop(tracker_sequence, None)
+                    self._unregister_tracker(tracker_sequence)
             
             return False
             
         except ValueError:
-            print(f"VISCA: Invalid value for {param_name}: {value}")
+            logger.warning("VISCA: Invalid value for %s: %s", param_name, value)
             return False
         except Exception as e:
-            print(f"VISCA: Error setting {param_name} on camera {cam_id}: {e}")
+            logger.warning("VISCA: Error setting %s on camera %s: %s", param_name, cam_id, e)
             return False
     
+    def _parse_inquiry_response(self, param_name: str, response: bytes, cam_id: int) -> Optional[str]:
+        """
+        Parse a VISCA inquiry reply payload into a parameter value string.
+
+        Args:
+            param_name: Parameter the inquiry was issued for
+            response: VISCA payload (header stripped)
+            cam_id: Camera ID, for logging
+
+        Returns:
+            Value string, or None if the reply could not be parsed
+        """
+        if not response or len(response) < 3:
+            return None
+
+        # Sony VISCA response format: 0x90 0x50 [values] 0xFF
+        # startswith is a single C-level memcmp versus two indexed comparisons
+        if response.startswith(b'\x90\x50'):
+            if len(response) == 4:  # Single byte response (DigitalBrightLevel): 90 50 0X FF
+                value = response[2]
+            elif len(response) == 7:  # Four byte response: 90 50 0p 0q 0r 0s FF
+                # Format for Iris, Gain, Shutter, ColorSaturation (4 nibbles)
+                value = decode_4byte(response)
+            else:
+                logger.warning("VISCA: Unexpected response length (%s) for %s: %s", len(response), param_name, _LazyHex(response))
+                return None
+            logger.debug("VISCA: Got %s=%s from camera %s", param_name, value, cam_id)
+            return str(value)
+
+        logger.warning("VISCA: Unexpected response format for %s: %s", param_name, _LazyHex(response))
+        return None
+
     async def _get_camera_params_uncontrolled_async(self, cam_id: int, venue_number: int) -> Optional[Dict[str, str]]:
         """
         Get current camera parameters via VISCA inquiry commands (uncontrolled async version).
-        
+
+        All inquiries are pushed onto the wire as one back-to-back burst on the
+        shared transport (Python exposes no sendmmsg, so consecutive sendto
+        calls are the closest equivalent), then their replies are awaited
+        concurrently. Missing replies are re-sent in batch retry rounds.
+
         Args:
             cam_id: Camera ID (1-6)
             venue_number: Venue number (1-15)
-            
+
         Returns:
             Dictionary of camera parameters or None if failed
         """
-        config_dict = {}
-        
-        # Clear any stale responses from command_futures
+        if not self.is_connected():
+            logger.warning("VISCA not connected for camera %s", cam_id)
+            return None
+
+        # Clear any stale pending trackers
         self._clear_pending_sequences()
-        
-        # Create tasks for all inquiry commands
-        inquiry_tasks = []
-        for param_name, commands in self.command_map.items():
-            if 'inquiry' in commands:
-                command = self._create_visca_packet(commands['inquiry'])
-                task = asyncio.create_task(
-                    self._send_visca_command_async(cam_id, venue_number, command, expect_completion=False)
-                )
-                inquiry_tasks.append((param_name, task))
-        
-        # Execute all inquiries concurrently
-        results = await asyncio.gather(*[task for _, task in inquiry_tasks], return_exceptions=True)
-        
-        # Process results
-        for i, (param_name, _) in enumerate(inquiry_tasks):
-            response = results[i]
-            
-            if isinstance(response, Exception):
-                print(f"VISCA: Exception getting {param_name} from camera {cam_id}: {response}")
-                config_dict[param_name] = "0"
-                continue
-            if isinstance(response, tuple):
-                response = response[0]
-
-            if response and len(response) >= 3:
-                # Parse Sony VISCA response format: 0x90 0x50 [values] 0xFF
-                if response[0] == 0x90 and response[1] == 0x50:
-                    if len(response) == 4:  # Single byte response (DigitalBrightLevel): 90 50 0X FF
-                        value = response[2]
-                        config_dict[param_name] = str(value)
-                        print(f"VISCA: Got {param_name}={value} from camera {cam_id}")
-                    elif len(response) == 7:  # Four byte response: 90 50 0p 0q 0r 0s FF
-                        # Format for Iris, Gain, Shutter, ColorSaturation (4 nibbles)
-                        p = response[2] & 0x0F
-                        q = response[3] & 0x0F
-                        r = response[4] & 0x0F
-                        s = response[5] & 0x0F
-                        value = (p << 12) | (q << 8) | (r << 4) | s
-                        config_dict[param_name] = str(value)
-                        print(f"VISCA: Got {param_name}={value} from camera {cam_id}")
-                    else:
-                        print(f"VISCA: Unexpected response length ({len(response)}) for {param_name}: {response.hex()}")
-                        config_dict[param_name] = "0"
+
+        addr = _camera_addr(cam_id, venue_number, self.port)
+        pending_names = list(self._inquiry_payloads)
+        # Pre-sized with the "0" fallback; successful parses overwrite in place
+        config_dict = dict.fromkeys(pending_names, "0")
+
+        for attempt in range(self.max_attempts):
+            # Burst: build, register and send all outstanding inquiries back-to-back
+            trackers = {}
+            for param_name in pending_names:
+                packet = self._build_visca_ip_packet(self._inquiry_payloads[param_name])
+                tracker = CommandTracker(self.sequence_number, expect_completion=False)
+                self._register_tracker(tracker)
+                trackers[param_name] = tracker
+                self.transport.sendto(packet, addr)
+
+            # Await all replies concurrently
+            responses = await asyncio.gather(
+                *(tracker.wait_for_ack(self.timeout) for tracker in trackers.values()),
+                return_exceptions=True
+            )
+
+            still_missing = []
+            for (param_name, tracker), response in zip(trackers.items(), responses):
+                self._unregister_tracker(tracker.sequence_number)
+                if isinstance(response, Exception):
+                    tracker.cancel()
+                    still_missing.append(param_name)
+                    continue
+                value = self._parse_inquiry_response(param_name, response, cam_id)
+                if value is None:
+                    still_missing.append(param_name)
                 else:
-                    print(f"VISCA: Unexpected response format for {param_name}: {response.hex()}")
-                    config_dict[param_name] = "0"
-            else:
-                print(f"VISCA: Failed to get {param_name} from camera {cam_id}")
-                config_dict[param_name] = "0"
-        
+                    config_dict[param_name] = value
+
+            pending_names = still_missing
+            if not pending_names:
+                break
+            if attempt < self.max_attempts - 1:
+                await asyncio.sleep(self.v_cycle)
+
+        for param_name in pending_names:
+            logger.warning("VISCA: Failed to get %s from camera %s", param_name, cam_id)
+
         return config_dict if config_dict else None
-    
+
     async def _set_camera_params_uncontrolled_async(self, cam_id: int, venue_number: int, params_dict: Dict[str, Union[int, str]]) -> bool:
         """
         Set camera parameters via VISCA commands with uncontrolled concurrent execution (async version).
-        
+
+        All set packets are pushed onto the wire as one back-to-back burst
+        (Python exposes no sendmmsg, so consecutive sendto calls are the
+        closest equivalent), then the replies are awaited together under a
+        single gather. Batch retry rounds re-send only the parameters that
+        did not get a reply, replacing per-parameter retry state machines.
+
         Args:
             cam_id: Camera ID (1-6)
             venue_number: Venue number (1-15)
             params_dict: Dictionary of parameters to set
-            
+
         Returns:
             True if successful, False otherwise
         """
         if not params_dict:
             return True
-        
-        # Create tasks for all parameters
-        tasks = []
-        for param_name, value in params_dict.items():
-            if param_name in self.command_map and 'set' in self.command_map[param_name]:
-                task = asyncio.create_task(
-                    self._set_single_param_async(cam_id, venue_number, param_name, value)
-                )
-                tasks.append(task)
-        
-        if not tasks:
-            print("VISCA: No valid parameters to set")
+
+        if not self.is_connected():
+            logger.warning("VISCA not connected for camera %s", cam_id)
             return False
-        
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Count successes
-        success_count = sum(1 for result in results if result is True)
-        total_params = len(params_dict)
-        
-        print(f"VISCA: Set {success_count}/{total_params} parameters successfully on camera {cam_id}")
-        
+
+        # Pre-resolve set commands; skip unknown parameters and bad values
+        plan = []
+        for param_name in params_dict.keys() & self._settable_params:
+            try:
+                plan.append((param_name, int(params_dict[param_name])))
+            except (TypeError, ValueError):
+                logger.warning("VISCA: Invalid value for %s: %s", param_name, params_dict[param_name])
+
+        if not plan:
+            logger.warning("VISCA: No valid parameters to set")
+            return False
+
+        addr = _camera_addr(cam_id, venue_number, self.port)
+        succeeded = set()
+        pending = plan
+
+        for attempt in range(self.max_attempts):
+            # Burst: build, register and send all outstanding commands back-to-back
+            trackers = {}
+            for param_name, int_value in pending:
+                packet = self._build_visca_ip_packet(self._set_payload(param_name, int_value))
+                tracker = CommandTracker(self.sequence_number, self.require_completion)
+                self._register_tracker(tracker)
+                trackers[param_name] = tracker
+                self.transport.sendto(packet, addr)
+
+            if self.require_completion:
+                waiters = [tracker.wait_for_completion(self.timeout) for tracker in trackers.values()]
+            else:
+                waiters = [tracker.wait_for_ack(self.timeout) for tracker in trackers.values()]
+            responses = await asyncio.gather(*waiters, return_exceptions=True)
+
+            still_pending = []
+            for (param_name, int_value), (name, tracker), response in zip(pending, trackers.items(), responses):
+                self._unregister_tracker(tracker.sequence_number)
+                if isinstance(response, Exception) or not response:
+                    tracker.cancel()
+                    still_pending.append((param_name, int_value))
+                    continue
+                # ACK (0x90 0x4z FF) or Completion (0x90 0x5z FF)
+                if response.startswith(b'\x90') and response[1] >> 4 in (0x4, 0x5):
+                    logger.debug("VISCA: Set %s=%s on camera %s", param_name, int_value, cam_id)
+                    succeeded.add(param_name)
+                else:
+                    logger.warning("VISCA: Failed to set %s on camera %s, response: %s", param_name, cam_id, _LazyHex(response))
+                    still_pending.append((param_name, int_value))
+
+            pending = still_pending
+            if not pending:
+                break
+            if attempt < self.max_attempts - 1:
+                await asyncio.sleep(self.v_cycle)
+
+        for param_name, _ in pending:
+            logger.warning("VISCA: No response for %s on camera %s", param_name, cam_id)
+
+        logger.debug("VISCA: Set %s/%s parameters successfully on camera %s", len(succeeded), len(plan), cam_id)
+
         # Return True if at least some parameters were set successfully
-        return success_count > 0
+        return len(succeeded) > 0
 
     async def set_camera_params_controlled_async(self, cam_id: int, venue_number: int, 
                                                  params_dict: Dict[str, Union[int, str]]) -> bool:
@@ -1078,20 +1652,18 @@ class VISCAProtocol(CameraProtocolInterface):
         if self.rate_limit_set and self.set_rate_limiter:
             await self.set_rate_limiter.acquire()
         
-        # Create tasks with semaphore control
-        tasks = []
-        for param_name, value in params_dict.items():
-            if param_name in self.command_map and 'set' in self.command_map[param_name]:
-                task = asyncio.create_task(
-                    self._set_single_param_controlled_async(cam_id, venue_number, param_name, value)
-                )
-                tasks.append((param_name, task))
+        # Collect coroutines; gather wraps them in tasks itself, so an
+        # explicit create_task per parameter only adds scheduling overhead
+        tasks = [
+            (param_name, self._set_single_param_controlled_async(cam_id, venue_number, param_name, params_dict[param_name]))
+            for param_name in params_dict.keys() & self._settable_params
+        ]
         
         if not tasks:
             return False
         
         # Execute with controlled concurrency
-        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+        results = await asyncio.gather(*(coro for _, coro in tasks), return_exceptions=True)
         
         # Analyze results and adjust concurrency
         success_count = sum(1 for result in results if result is True)
@@ -1109,26 +1681,48 @@ class VISCAProtocol(CameraProtocolInterface):
                 # High failure rate - reduce concurrency
                 self.current_concurrency_limit = max(1, self.current_concurrency_limit // 2)
                 self.concurrency_semaphore = asyncio.Semaphore(self.current_concurrency_limit)
-                print(f"VISCA: Reduced concurrency to {self.current_concurrency_limit} due to failures")
+                logger.info("VISCA: Reduced concurrency to %s due to failures", self.current_concurrency_limit)
                 
                 # Retry failed parameters sequentially
                 failed_params = {param_name: params_dict[param_name] 
                                for (param_name, _), result in zip(tasks, results) if result is not True}
                 if failed_params:
-                    print(f"VISCA: Retrying {len(failed_params)} failed parameters sequentially")
+                    logger.warning("VISCA: Retrying %s failed parameters sequentially", len(failed_params))
                     retry_success = await self._retry_sequential(cam_id, venue_number, failed_params)
                     success_count += retry_success
+            elif failure_rate < 0.05 and self.current_concurrency_limit < self.max_concurrent:
+                # Clean batch - probe additively back up towards the
+                # configured ceiling (AIMD, like TCP congestion control)
+                self.current_concurrency_limit += 1
+                self.concurrency_semaphore = asyncio.Semaphore(self.current_concurrency_limit)
+                logger.debug("VISCA: Raised concurrency to %s", self.current_concurrency_limit)
         
-        print(f"VISCA: Set {success_count}/{total_params} parameters successfully on camera {cam_id}")
+        logger.debug("VISCA: Set %s/%s parameters successfully on camera %s", success_count, total_params, cam_id)
         return success_count > 0
 
+    async def _pace(self):
+        """
+        Leaky-bucket pacing shared across controlled operations.
+
+        Each caller claims the next send slot on a shared schedule and sleeps
+        only for its own gap, so a batch of N coroutines costs at most one
+        timer each instead of N identical pacing sleeps, and the first sender
+        goes out immediately.
+        """
+        now = time.monotonic()
+        slot = self._next_send_at if self._next_send_at > now else now
+        self._next_send_at = slot + self.concurrent_pacing
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
     async def _set_single_param_controlled_async(self, cam_id: int, venue_number: int,
                                                  param_name: str, value: Union[int, str]) -> bool:
         """Set single parameter with semaphore control and pacing."""
         async with self.concurrency_semaphore:
-            # Add pacing for concurrent operations
+            # Pace concurrent operations off the shared schedule
             if self.current_concurrency_limit > 1:
-                await asyncio.sleep(self.concurrent_pacing)
+                await self._pace()
             
             return await self._set_single_param_async(cam_id, venue_number, param_name, value)
 
@@ -1160,30 +1754,23 @@ class VISCAProtocol(CameraProtocolInterface):
         config_dict = {}
         self._clear_pending_sequences()
         
-        # Create tasks with semaphore control
+        # Collect coroutines; gather wraps them in tasks itself
         inquiry_tasks = []
         for param_name, commands in self.command_map.items():
             if 'inquiry' in commands:
-                command = self._create_visca_packet(commands['inquiry'])
-                task = asyncio.create_task(
-                    self._get_single_param_controlled_async(cam_id, venue_number, command)
-                )
-                inquiry_tasks.append((param_name, task))
+                command = self._inquiry_payloads[param_name]
+                coro = self._get_single_param_controlled_async(cam_id, venue_number, command)
+                inquiry_tasks.append((param_name, coro))
         
         # Execute with controlled concurrency
-        results = await asyncio.gather(*[task for _, task in inquiry_tasks], return_exceptions=True)
+        results = await asyncio.gather(*(coro for _, coro in inquiry_tasks), return_exceptions=True)
         
-        # Process results (same parsing logic as original)
+        # Process results through the shared reply parser
         for (param_name, _), result in zip(inquiry_tasks, results):
-            if isinstance(result, bytes) and len(result) >= 3:
-                if result[0] == 0x90 and result[1] == 0x50:
-                    if len(result) == 4:
-                        value = result[2]
-                        config_dict[param_name] = str(value)
-                    elif len(result) == 7:
-                        p, q, r, s = result[2] & 0x0F, result[3] & 0x0F, result[4] & 0x0F, result[5] & 0x0F
-                        value = (p << 12) | (q << 8) | (r << 4) | s
-                        config_dict[param_name] = str(value)
+            if isinstance(result, bytes):
+                value = self._parse_inquiry_response(param_name, result, cam_id)
+                if value is not None:
+                    config_dict[param_name] = value
         
         return config_dict if config_dict else None
 
@@ -1191,17 +1778,88 @@ class VISCAProtocol(CameraProtocolInterface):
                                                 command: bytes) -> Optional[bytes]:
         """Get single parameter with semaphore control and pacing."""
         async with self.concurrency_semaphore:
-            # Add pacing for concurrent operations
+            # Pace concurrent operations off the shared schedule
             if self.current_concurrency_limit > 1:
-                await asyncio.sleep(self.concurrent_pacing)
+                await self._pace()
             
             response, _ = await self._send_visca_command_async(
                 cam_id, venue_number, command, expect_completion=False
             )
             return response
 
-    async def set_camera_params_async(self, cam_id: int, venue_number: int, 
+    def queue_set(self, cam_id: int, venue_number: int, param_name: str, value: Union[int, str]):
+        """
+        Queue a parameter set with debouncing to coalesce rapid identical updates.
+
+        Consecutive sets to the same (camera, venue, parameter) within the coalesce
+        window keep only the latest value, cutting on-wire traffic when a control
+        loop nudges the same parameter every frame.
+
+        Args:
+            cam_id: Camera ID (1-6)
+            venue_number: Venue number (1-15)
+            param_name: Parameter name to set
+            value: Parameter value (latest value wins within the window)
+        """
+        key = (cam_id, venue_number, param_name)
+        pending = self._pending_sets.get(key)
+        if pending is not None:
+            # Overwrite pending value; flush is already scheduled
+            pending[0] = value
+            return
+
+        loop = asyncio.get_running_loop()
+        handle = loop.call_later(self.coalesce_ms / 1000.0, self._flush_pending_set, key)
+        self._pending_sets[key] = [value, handle]
+
+    def _flush_pending_set(self, key: Tuple[int, int, str]):
+        """Flush a coalesced parameter set by issuing the real async set."""
+        pending = self._pending_sets.pop(key, None)
+        if pending is None:
+            return
+
+        cam_id, venue_number, param_name = key
+        value = pending[0]
+        task = asyncio.ensure_future(
+            self._set_camera_params_direct(cam_id, venue_number, {param_name: value})
+        )
+        # Keep a reference until the task completes and surface failures,
+        # instead of leaving an unretrieved fire-and-forget task behind
+        self._flush_tasks.add(task)
+        task.add_done_callback(functools.partial(self._on_flush_done, key))
+
+    def _on_flush_done(self, key: Tuple[int, int, str], task: 'asyncio.Task'):
+        """Done-callback for flushed sets: drop the reference, log failures."""
+        self._flush_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Debounced set for %s failed: %s", key, exc)
+        elif not task.result():
+            logger.warning("Debounced set for %s was not acknowledged", key)
+
+    def cancel_pending_sets(self):
+        """Cancel all queued (not yet flushed) parameter sets."""
+        for pending in self._pending_sets.values():
+            pending[1].cancel()
+        self._pending_sets.clear()
+
+    async def set_camera_params_async(self, cam_id: int, venue_number: int,
                                       params_dict: Dict[str, Union[int, str]]) -> bool:
+        """Route to the debounce queue or the direct set path based on config."""
+        if self.debounce_sets:
+            # Coalesce rapid repeat sets: only the latest value per
+            # parameter inside the window goes on the wire. Acceptance is
+            # reported by the flush task's done-callback, so this returns
+            # True for "queued" rather than "acknowledged".
+            for param_name, value in params_dict.items():
+                self.queue_set(cam_id, venue_number, param_name, value)
+            return True
+        return await self._set_camera_params_direct(cam_id, venue_number, params_dict)
+
+    async def _set_camera_params_direct(self, cam_id: int, venue_number: int,
+                                        params_dict: Dict[str, Union[int, str]]) -> bool:
         """Route to controlled or uncontrolled version based on config."""
         if self.concurrency_enabled:
             return await self.set_camera_params_controlled_async(cam_id, venue_number, params_dict)
@@ -1235,28 +1893,56 @@ class VISCAProtocol(CameraProtocolInterface):
 
 class ProtocolFactory:
     """Factory class for creating camera protocol instances."""
-    
-    @staticmethod
-    def create_protocol(protocol_type: str = "cgi", config_file: str = None) -> CameraProtocolInterface:
+
+    # Memoized instances keyed by (protocol type, config file): repeated
+    # factory calls otherwise re-parse the config and, for VISCA, open a
+    # fresh UDP socket each time
+    _instances: Dict[Tuple[str, Optional[str]], CameraProtocolInterface] = {}
+
+    @classmethod
+    def create_protocol(cls, protocol_type: str = "cgi", config_file: str = None) -> CameraProtocolInterface:
         """
-        Create a camera protocol instance.
-        
+        Create (or reuse) a camera protocol instance.
+
+        Instances are cached per (protocol_type, config_file); disconnect()
+        releases sockets but keeps the instance reusable. Call reset() for
+        clean-slate semantics.
+
         Args:
             protocol_type: Type of protocol ('cgi' or 'visca')
             config_file: Path to configuration file
-            
+
         Returns:
             Protocol instance
-            
+
         Raises:
             ValueError: If protocol type is not supported
         """
-        if protocol_type.lower() == "cgi":
-            return CGIProtocol(config_file)
-        elif protocol_type.lower() == "visca":
-            return VISCAProtocol(config_file)
+        protocol_type = protocol_type.lower()
+        key = (protocol_type, config_file)
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        if protocol_type == "cgi":
+            instance = CGIProtocol(config_file)
+        elif protocol_type == "visca":
+            instance = VISCAProtocol(config_file)
         else:
             raise ValueError(f"Unsupported protocol type: {protocol_type}")
+
+        cls._instances[key] = instance
+        return instance
+
+    @classmethod
+    def reset(cls):
+        """Disconnect and drop all cached protocol instances."""
+        for instance in cls._instances.values():
+            try:
+                instance.disconnect()
+            except Exception:
+                pass
+        cls._instances.clear()
     
     @staticmethod
     def create_protocol_from_config(config_file: str = None) -> CameraProtocolInterface:
@@ -1273,11 +1959,10 @@ class ProtocolFactory:
             import os
             config_file = os.path.join(os.path.dirname(__file__), '..', '..', 'configs', 'camera_control_config.json')
         
-        try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-                protocol_type = config.get('protocol', {}).get('type', 'cgi')
-                return ProtocolFactory.create_protocol(protocol_type, config_file)
-        except FileNotFoundError:
-            print(f"Config file {config_file} not found, using default CGI protocol")
+        config = _load_config_cached(config_file)
+        if not config:
+            logger.warning("Config file %s not found, using default CGI protocol", config_file)
             return CGIProtocol(config_file)
+
+        protocol_type = config.get('protocol', {}).get('type', 'cgi')
+        return ProtocolFactory.create_protocol(protocol_type, config_file)
@@ -0,0 +1,44 @@
+"""
+VISCA codec helpers.
+
+The per-command byte shuffling (VISCA-IP header build and 4-nibble response
+decode) is pure byte work on short buffers, so it benefits from a compiled
+implementation. When the optional Cython extension (_visca_codec.pyx, built
+with `cythonize -i`) is importable its functions are used; otherwise the
+pure-Python fallbacks below are.
+"""
+
+import struct
+
+_VISCA_IP_HEADER = struct.Struct('>HHI')
+
+
+def _build_ip_packet_py(payload: bytes, sequence_number: int) -> bytes:
+    """Build a VISCA-IP packet (8-byte header + payload) for the given payload."""
+    # Message type: 0x09 in the second payload byte marks an inquiry
+    if len(payload) >= 2 and payload[1] == 0x09:
+        msg_type = 0x0110  # Inquiry
+    else:
+        msg_type = 0x0100  # Command
+    return _VISCA_IP_HEADER.pack(msg_type, len(payload), sequence_number) + payload
+
+
+def _decode_4byte_py(response: bytes) -> int:
+    """Decode the 4-nibble value from a 90 50 0p 0q 0r 0s FF inquiry reply."""
+    # Single 4-byte big-endian load, then compact the four low nibbles
+    x = int.from_bytes(response[2:6], 'big')
+    return (
+        ((x & 0x0F000000) >> 12)
+        | ((x & 0x000F0000) >> 8)
+        | ((x & 0x00000F00) >> 4)
+        | (x & 0x0000000F)
+    )
+
+
+try:
+    from ._visca_codec import build_ip_packet, decode_4byte
+    HAVE_NATIVE = True
+except ImportError:
+    build_ip_packet = _build_ip_packet_py
+    decode_4byte = _decode_4byte_py
+    HAVE_NATIVE = False
@@ -0,0 +1,85 @@
+"""
+Numba kernel for the camera settings adjuster.
+
+Fuses the per-frame decision pipeline - outer-bound check, direction,
+candidate-parameter cost comparison - into one explicit native loop over
+SoA arrays, so a full adjustment decision runs in microseconds with no
+Python-level dict traffic. The wrapper in utils packs camera state into
+index arrays and unpacks the returned deltas.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def adjust_core(cur_idx, range_lens, feat, range_lo, range_hi,
+                outer_lo, outer_hi, rules, base_cost, direction, deltas):
+    """
+    Compute per-parameter adjustment deltas for one feature vector.
+
+    Args:
+        cur_idx: Current index of each parameter in its range (-1 unknown)
+        range_lens: Length of each parameter's value range
+        feat: Feature values, one per tracked feature
+        range_lo, range_hi: Raw acceptable bounds per feature
+        outer_lo, outer_hi: Outer hysteresis bounds per feature
+        rules: (n_features, n_params) uint8 matrix; nonzero where the
+            parameter may be adjusted for the feature
+        base_cost: Base cost per parameter
+        direction: Preferred direction per parameter (+1/-1/0)
+        deltas: Output array, written with -1/0/+1 per parameter
+    """
+    n_params = cur_idx.shape[0]
+    for p in range(n_params):
+        deltas[p] = 0
+
+    for f in range(feat.shape[0]):
+        value = feat[f]
+        if outer_lo[f] <= value <= outer_hi[f]:
+            continue
+
+        if value < range_lo[f]:
+            feature_delta = value - range_lo[f]
+            increase = True
+        elif value > range_hi[f]:
+            feature_delta = value - range_hi[f]
+            increase = False
+        else:
+            continue
+
+        best_param = -1
+        best_cost = np.inf
+        for p in range(n_params):
+            if rules[f, p] == 0:
+                continue
+            current = cur_idx[p]
+            if current < 0:
+                continue
+            if increase:
+                if current >= range_lens[p] - 1:
+                    continue
+                target = current + 1
+            else:
+                if current <= 0:
+                    continue
+                target = current - 1
+
+            # Same arithmetic as cost_kernel for a single-step move
+            cost = base_cost[p] * 1.2
+            if direction[p] > 0.0 and target < current:
+                cost *= 1.5
+            elif direction[p] < 0.0 and target > current:
+                cost *= 1.5
+            abs_delta = abs(feature_delta)
+            if abs_delta > 0.1:
+                cost *= 0.8
+            elif abs_delta < 0.02:
+                cost *= 1.2
+
+            if cost < best_cost:
+                best_cost = cost
+                best_param = p
+
+        if best_param >= 0:
+            deltas[best_param] = 1 if increase else -1
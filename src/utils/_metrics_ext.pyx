@@ -0,0 +1,65 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled fused image-metrics hot path.
+
+Ahead-of-time compiled version of the reductions in _metrics_kernel.py, so
+production deployments skip the Numba JIT warm-up and pay no dispatch
+overhead. Build in place with:
+
+    cythonize -i src/utils/_metrics_ext.pyx
+
+utils.py prefers this module when built, then the Numba kernel, then the
+per-metric OpenCV path.
+"""
+
+import numpy as np
+
+
+def metrics_kernel(const unsigned char[:, :, ::1] img):
+    """
+    Single-pass metric reductions over a BGR uint8 frame.
+
+    Returns the same (sum_gray, sum_lap, sum_lap2, sum_sat) tuple as the
+    Numba kernel: grayscale sum (ITU-R 601 weights), Laplacian sum and sum
+    of squares over the frame interior (3x3 cross stencil), and HSV
+    saturation sum.
+    """
+    cdef Py_ssize_t height = img.shape[0]
+    cdef Py_ssize_t width = img.shape[1]
+    cdef Py_ssize_t x, y
+    cdef double b, g, r, value, max_c, min_c, lap
+    cdef double sum_gray = 0.0
+    cdef double sum_sat = 0.0
+    cdef double sum_lap = 0.0
+    cdef double sum_lap2 = 0.0
+
+    gray_arr = np.empty((height, width), dtype=np.float32)
+    cdef float[:, ::1] gray = gray_arr
+
+    for y in range(height):
+        for x in range(width):
+            b = img[y, x, 0]
+            g = img[y, x, 1]
+            r = img[y, x, 2]
+            value = 0.114 * b + 0.587 * g + 0.299 * r
+            gray[y, x] = <float> value
+            sum_gray += value
+
+            max_c = b if b > g else g
+            if r > max_c:
+                max_c = r
+            min_c = b if b < g else g
+            if r < min_c:
+                min_c = r
+            if max_c > 0.0:
+                sum_sat += (max_c - min_c) * 255.0 / max_c
+
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            lap = (gray[y - 1, x] + gray[y + 1, x]
+                   + gray[y, x - 1] + gray[y, x + 1]
+                   - 4.0 * gray[y, x])
+            sum_lap += lap
+            sum_lap2 += lap * lap
+
+    return sum_gray, sum_lap, sum_lap2, sum_sat
@@ -0,0 +1,69 @@
+"""
+Fused per-frame metrics kernel.
+
+Brightness, blur (Laplacian variance) and saturation each used to cost a
+separate full-frame pass (cvtColor, Laplacian, cvtColor to HSV). This module
+fuses them into one compiled kernel that walks the BGR frame once, so the
+pixels stay hot in cache between the three reductions. Numba is an optional
+dependency: utils.py falls back to the per-metric OpenCV path when this
+module fails to import.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def metrics_kernel(img):
+    """
+    Single-pass metric reductions over a BGR uint8 frame.
+
+    Args:
+        img: BGR image as a (H, W, 3) uint8 array
+
+    Returns:
+        Tuple (sum_gray, sum_lap, sum_lap2, sum_sat) of float reductions:
+        grayscale sum (ITU-R 601 weights, matching cv2.COLOR_BGR2GRAY),
+        Laplacian sum and sum of squares over the (H-2, W-2) interior
+        (3x3 cross stencil, matching cv2.Laplacian ksize=1), and HSV
+        saturation sum (matching the cv2.COLOR_BGR2HSV S channel).
+    """
+    height = img.shape[0]
+    width = img.shape[1]
+    gray = np.empty((height, width), dtype=np.float32)
+
+    sum_gray = 0.0
+    sum_sat = 0.0
+    for y in prange(height):
+        row_gray = 0.0
+        row_sat = 0.0
+        for x in range(width):
+            b = np.float64(img[y, x, 0])
+            g = np.float64(img[y, x, 1])
+            r = np.float64(img[y, x, 2])
+            value = 0.114 * b + 0.587 * g + 0.299 * r
+            gray[y, x] = value
+            row_gray += value
+
+            max_c = max(b, max(g, r))
+            min_c = min(b, min(g, r))
+            if max_c > 0.0:
+                row_sat += (max_c - min_c) * 255.0 / max_c
+        sum_gray += row_gray
+        sum_sat += row_sat
+
+    sum_lap = 0.0
+    sum_lap2 = 0.0
+    for y in prange(1, height - 1):
+        row_lap = 0.0
+        row_lap2 = 0.0
+        for x in range(1, width - 1):
+            lap = (gray[y - 1, x] + gray[y + 1, x]
+                   + gray[y, x - 1] + gray[y, x + 1]
+                   - 4.0 * gray[y, x])
+            row_lap += lap
+            row_lap2 += lap * lap
+        sum_lap += row_lap
+        sum_lap2 += row_lap2
+
+    return sum_gray, sum_lap, sum_lap2, sum_sat
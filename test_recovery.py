@@ -7,21 +7,29 @@ color disturbances by simulating various scenarios.
 """
 
 import asyncio
+import logging
 import sys
 import os
 
+import numpy as np
+
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from utils.utils import CameraSettingsAdjuster, acceptable_ranges
 from cost.cost_functions import CostFunctionCalculator
 
+# Midpoint of the scenario brightness range used for cost deltas
+BRIGHTNESS_MIDPOINT = 0.55
+
+log = logging.getLogger(__name__)
+
 def test_recovery_scenarios():
     """Test various recovery scenarios."""
-    
-    print("=" * 60)
-    print("CAMERA RECOVERY TEST")
-    print("=" * 60)
+
+    log.info("=" * 60)
+    log.info("CAMERA RECOVERY TEST")
+    log.info("=" * 60)
     
     # Initialize components
     adjuster = CameraSettingsAdjuster(acceptable_ranges)
@@ -75,46 +83,60 @@ def test_recovery_scenarios():
         "ColorSaturation": "7"
     }
     
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"\n--- Scenario {i}: {scenario['name']} ---")
-        print(f"Image features: {scenario['features']}")
-        print(f"Expected: {scenario['expected']}")
-        
-        # Test adjustment logic
-        adjustments = adjuster.adjust_camera_settings(sample_config, scenario['features'])
-        
+    # SoA pass: pack all scenario features into one (N, 2) array and run the
+    # batch adjustment in a single call, then report in a second pass so the
+    # math is not interleaved with print I/O
+    feature_order = list(adjuster.acceptable_ranges.keys())
+    features_arr = np.array(
+        [[s['features'][f] for f in feature_order] for s in scenarios],
+        dtype=np.float32)
+    batch_adjustments = adjuster.adjust_camera_settings_batch(sample_config, features_arr)
+
+    for i, (scenario, adjustments) in enumerate(zip(scenarios, batch_adjustments), 1):
+        log.info("--- Scenario %d: %s ---", i, scenario['name'])
+        log.info("Image features: %s", scenario['features'])
+        log.info("Expected: %s", scenario['expected'])
+
         if adjustments:
-            print("✓ Adjustments suggested:")
+            log.info("✓ Adjustments suggested:")
             for param, value in adjustments.items():
                 current = sample_config.get(param, 'N/A')
-                print(f"  {param}: {current} -> {value}")
-                
-                # Show cost analysis
+                log.info("  %s: %s -> %s", param, current, value)
+
+                # Cost analysis is diagnostic only: skip the lookups and
+                # arithmetic entirely unless debug output is wanted
+                if not log.isEnabledFor(logging.DEBUG):
+                    continue
                 param_range = adjuster.cam_params_range.get(param, [])
                 if param_range:
                     try:
-                        current_idx = param_range.index(str(current))
-                        target_idx = param_range.index(str(value))
-                        feature_delta = scenario['features']['normalized_brightness'] - 0.55  # Midpoint
+                        index_map = adjuster.cam_params_index[param]
+                        current_idx = index_map[str(current)]
+                        target_idx = index_map[str(value)]
+                        if current_idx == target_idx:
+                            # No-op adjustment: cost is trivially zero
+                            log.debug("    Cost: 0.00")
+                            continue
+                        feature_delta = scenario['features']['normalized_brightness'] - BRIGHTNESS_MIDPOINT
                         cost = cost_calc.calculate_adjustment_cost(
                             param, current, value, param_range, feature_delta
                         )
-                        print(f"    Cost: {cost:.2f}")
-                    except (ValueError, IndexError):
-                        print(f"    Cost: Unable to calculate")
+                        log.debug("    Cost: %.2f", cost)
+                    except (KeyError, ValueError, IndexError):
+                        log.debug("    Cost: Unable to calculate")
         else:
-            print("✓ No adjustments needed")
-        
-        print(f"Result: {'✓ PASS' if adjustments or scenario['expected'] == 'No adjustment' else '✗ FAIL'}")
-    
-    print(f"\n{'='*60}")
-    print("RECOVERY TEST SUMMARY:")
-    print("• Expanded acceptable ranges for better recovery")
-    print("• Reduced hysteresis for more responsive adjustments")
-    print("• Aggressive multi-step adjustments for large deviations")
-    print("• Enhanced cost function for better parameter selection")
-    print("• Recovery mode enabled for fast correction")
-    print(f"{'='*60}")
+            log.info("✓ No adjustments needed")
+
+        log.info("Result: %s", '✓ PASS' if adjustments or scenario['expected'] == 'No adjustment' else '✗ FAIL')
+
+    log.info("=" * 60)
+    log.info("RECOVERY TEST SUMMARY:")
+    log.info("• Expanded acceptable ranges for better recovery")
+    log.info("• Reduced hysteresis for more responsive adjustments")
+    log.info("• Aggressive multi-step adjustments for large deviations")
+    log.info("• Enhanced cost function for better parameter selection")
+    log.info("• Recovery mode enabled for fast correction")
+    log.info("=" * 60)
 
 def test_hysteresis_bounds():
     """Test hysteresis bounds calculation."""
@@ -141,5 +163,6 @@ def test_hysteresis_bounds():
         print(f"Value {value:.2f}: {'ADJUST' if should_adjust else 'NO ADJUST'} - {reason}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_recovery_scenarios()
     test_hysteresis_bounds()
@@ -18,6 +18,31 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from protocols.camera_protocol import ProtocolFactory
 from utils.utils import CameraSettingsAdjuster, acceptable_ranges
 
+async def wait_for_param(protocol, cam_id, venue_number, param, expected, timeout=1.0):
+    """
+    Poll the camera until a parameter reads back as expected.
+
+    Replaces the fixed 1 s settling sleep: polls every 50 ms with the delay
+    doubling up to 200 ms, returning as soon as the readback matches (the
+    typical camera settles in under 100 ms) or when the timeout elapses.
+
+    Returns:
+        The last readback dict (or None if retrieval failed)
+    """
+    deadline = asyncio.get_event_loop().time() + timeout
+    delay = 0.05
+    while True:
+        if hasattr(protocol, 'get_camera_params_async'):
+            params = await protocol.get_camera_params_async(cam_id, venue_number)
+        else:
+            params = protocol.get_camera_params(cam_id, venue_number)
+        if params and str(params.get(param)) == str(expected):
+            return params
+        if asyncio.get_event_loop().time() >= deadline:
+            return params
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.2)
+
 async def test_protocols():
     """Test both CGI and VISCA protocols."""
     
@@ -64,10 +89,8 @@ async def test_protocols():
                 if success:
                     print("✓ Parameter setting successful")
                     
-                    # Verify change
-                    import time
-                    time.sleep(1)
-                    new_params = protocol.get_camera_params(cam_id, 13)
+                    # Verify change as soon as the camera reports it
+                    new_params = await wait_for_param(protocol, cam_id, 13, 'ColorSaturation', '7')
                     if new_params:
                         old_val = params.get('ColorSaturation', 'N/A')
                         new_val = new_params.get('ColorSaturation', 'N/A')
@@ -146,9 +169,8 @@ async def test_protocols_async():
                     if success:
                         print("✓ Async parameter setting successful")
                         
-                        # Verify change
-                        await asyncio.sleep(1)
-                        new_params = await protocol.get_camera_params_async(cam_id, 13)
+                        # Verify change as soon as the camera reports it
+                        new_params = await wait_for_param(protocol, cam_id, 13, 'ColorSaturation', '7')
                         if new_params:
                             old_val = params.get('ColorSaturation', 'N/A')
                             new_val = new_params.get('ColorSaturation', 'N/A')
@@ -6,19 +6,41 @@ This script validates the implementation of the enhanced camera control system
 including cost functions, hysteresis, protocol abstraction, and ROI detection.
 """
 
+import asyncio
+import functools
 import json
 import numpy as np
 import cv2
 import sys
 import os
 
+# orjson parses config files ~2-4x faster than the stdlib (optional
+# dependency); json remains as fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from cost.cost_functions import CostFunctionCalculator
 from protocols.camera_protocol import ProtocolFactory, CGIProtocol
 from detection.roi_detection import ROIDetector
-from utils.utils import CameraSettingsAdjuster, acceptable_ranges
+from utils.utils import CameraSettingsAdjuster, Feature, acceptable_ranges
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path, mtime_ns):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def load_config(path):
+    """Load a JSON config through an mtime-keyed cache (orjson when available)."""
+    path = os.path.abspath(path)
+    return _load_config_cached(path, os.stat(path).st_mtime_ns)
 
 
 def test_cost_functions():
@@ -106,12 +128,11 @@ def test_camera_settings_adjuster():
         "ColorSaturation": "7"
     }
     
-    sample_features = {
-        "normalized_brightness": 0.15,  # Below acceptable range
-        "normalized_saturation": 0.45,  # Within acceptable range
-        "mask_coverage": 85.0
-    }
-    
+    # Positional feature vector indexed by the Feature enum (fast path)
+    sample_features = np.empty(len(Feature), dtype=np.float32)
+    sample_features[Feature.BRIGHTNESS] = 0.15  # Below acceptable range
+    sample_features[Feature.SATURATION] = 0.45  # Within acceptable range
+
     # Test adjustment logic
     adjustments = adjuster.adjust_camera_settings(sample_config, sample_features)
     print(f"Suggested adjustments: {adjustments}")
@@ -123,15 +144,49 @@ def test_camera_settings_adjuster():
     print("✓ Camera Settings Adjuster test passed\n")
 
 
+def test_visca_set_debouncing():
+    """Test that rapid repeat sets coalesce into one flushed send."""
+    print("Testing VISCA Set Debouncing...")
+
+    protocol = ProtocolFactory.create_protocol("visca")
+    sent = []
+
+    async def record_set(cam_id, venue_number, params_dict):
+        sent.append(params_dict)
+        return True
+
+    original_direct = protocol._set_camera_params_direct
+    protocol._set_camera_params_direct = record_set
+
+    async def scenario():
+        protocol.debounce_sets = True
+        try:
+            # Three rapid sets within the coalesce window: latest value wins
+            for value in ('3', '5', '7'):
+                await protocol.set_camera_params_async(2, 13, {'ColorSaturation': value})
+            await asyncio.sleep(protocol.coalesce_ms / 1000.0 + 0.05)
+        finally:
+            protocol.debounce_sets = False
+            protocol.cancel_pending_sets()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        protocol._set_camera_params_direct = original_direct
+
+    assert sent == [{'ColorSaturation': '7'}], f"Unexpected flushed sets: {sent}"
+    print(f"Coalesced 3 rapid sets into {len(sent)} send: {sent[0]}")
+    print("✓ VISCA Set Debouncing test passed\n")
+
+
 def test_configuration_loading():
     """Test configuration file loading."""
     print("Testing Configuration Loading...")
     
     try:
         config_path = os.path.join(os.path.dirname(__file__), '..', 'configs', 'camera_control_config.json')
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        
+        config = load_config(config_path)
+
         print(f"Cost weights loaded: {len(config.get('cost_weights', {}))} parameters")
         print(f"Hysteresis config: {config.get('hysteresis', {})}")
         print(f"Protocol type: {config.get('protocol', {}).get('type', 'unknown')}")
@@ -151,9 +206,8 @@ def test_integration():
     try:
         # Load configuration
         config_path = os.path.join(os.path.dirname(__file__), '..', 'configs', 'camera_control_config.json')
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        
+        config = load_config(config_path)
+
         # Initialize components
         roi_detector = ROIDetector()
         protocol = ProtocolFactory.create_protocol_from_config()
@@ -185,6 +239,7 @@ def main():
     test_configuration_loading()
     test_cost_functions()
     test_protocol_abstraction()
+    test_visca_set_debouncing()
     test_roi_detection()
     test_camera_settings_adjuster()
     test_integration()